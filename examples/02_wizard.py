@@ -30,14 +30,11 @@ class WizardState(PageState):
 
 st.title("Onboarding Wizard")
 
-# Progress bar based on total steps (4)
-st.progress(WizardState.step / 4)
-
-if WizardState.step == 1:
+def render_step1():
     st.subheader("Step 1: Personal Info")
     
     # Bind widgets directly to state variables.
-    # The ** operator unpacks the binding dictionary (value, on_change, key) into the widget.
+    # The ** operator unpacks the binding dictionary (on_change, key) into the widget.
     st.text_input("Full Name", **WizardState.bind("name"))
     st.text_input("Email Address", **WizardState.bind("email"))
     
@@ -49,7 +46,8 @@ if WizardState.step == 1:
         else:
             st.error("Please fill in all fields.")
 
-elif WizardState.step == 2:
+
+def render_step2():
     st.subheader("Step 2: Role Selection")
     
     roles = ["Developer", "Designer", "Product Manager", "Data Scientist"]
@@ -65,7 +63,8 @@ elif WizardState.step == 2:
             WizardState.step += 1
             st.rerun()
 
-elif WizardState.step == 3:
+
+def render_step3():
     st.subheader("Step 3: Terms and Conditions")
     
     st.markdown("Please read and accept our terms...")
@@ -84,7 +83,8 @@ elif WizardState.step == 3:
             else:
                 st.error("You must agree to the terms.")
 
-elif WizardState.step == 4:
+
+def render_step4():
     st.subheader("Step 4: Summary")
     st.success("Registration Complete!")
     
@@ -98,3 +98,21 @@ elif WizardState.step == 4:
     if st.button("Start Over", type="primary"):
         WizardState.reset() # Resets all fields to their defaults
         st.rerun()
+
+
+# Each step number maps to the function rendering it
+STEPS = {
+    1: render_step1,
+    2: render_step2,
+    3: render_step3,
+    4: render_step4,
+}
+
+# Read the current step once and dispatch to its renderer.
+# Unknown steps (e.g. a hand-edited ?step=9) fall back to the first one.
+step = WizardState.step
+
+# Progress bar based on total steps (4)
+st.progress(min(max(step, 1), len(STEPS)) / len(STEPS))
+
+STEPS.get(step, render_step1)()
@@ -20,16 +20,16 @@ class FilterState(PageState):
     State class managing the filter selection.
     """
     
-    # Map friendly URL strings to internal integer values.
-    # The 'value_map' dictionary keys are what appear in the URL.
-    # The values are the STRING representation of the internal value.
+    # Map internal integer values to friendly URL strings.
+    # The 'value_map' dictionary keys are the internal values.
+    # The values are what appear in the URL.
     status_filter: int = StateVar(
         default=1, # Default is Active (1)
         url_key="status",
         value_map={
-            "pending": 0,
-            "active": 1,
-            "archived": 2
+            0: "pending",
+            1: "active",
+            2: "archived"
         }
     )
 
@@ -80,17 +80,9 @@ st.dataframe(
 
 st.divider()
 
-# Helper to reverse look up the URL string from the current state value
+# Look up the URL string the current state value is written as
 # (Just for display purposes in this example)
-def get_url_string(value):
-    # Access the mapping directly from the field definition for demonstration
-    mapping = FilterState.schema()['status_filter']['value_map']
-    for url_str, internal_val_str in mapping.items():
-        if internal_val_str == str(value):
-            return url_str
-    return "unknown"
-
-current_url_val = get_url_string(FilterState.status_filter)
+current_url_val = FilterState.url_value_for("status_filter", FilterState.status_filter)
 
 st.info(f"Check the URL! It says `?status={current_url_val}` instead of `?status={FilterState.status_filter}`.")
 st.caption(f"Internal State Value: `{FilterState.status_filter}` (type: {type(FilterState.status_filter).__name__})")
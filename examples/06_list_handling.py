@@ -5,7 +5,7 @@ This example demonstrates how the framework handles lists and other iterables (s
 It supports generic types like `list[int]`, `list[str]`, `list[date]`, etc.
 
 The framework automatically serializes these lists into a compact Base64 encoded JSON string
-for the URL, keeping it clean and safe.
+for the URL, keeping it clean and safe. Plain integer lists are written as a readable `1||2||3`.
 """
 
 import streamlit as st
@@ -78,13 +78,8 @@ This example shows how the `Config` inner class can control URL behavior.
 By default, states are **Selfish** (they clear other URL params) and **Restoring** (they restore their own params if missing).
 """)
 
-# Initialize both states to see initial URL
-prefixed_name = PrefixedState.name
-prefixed_value = PrefixedState.value
-another_value = AnotherState.other
-app_filter = AppState.filter
-app_page = AppState.page
-shared_extra = SharedState.extra
+# Initialize this page's states in a single pass over the query params
+PageState.hydrate_all(PrefixedState, AnotherState, AppState, SharedState)
 
 st.subheader("1. Prefixed State (Default Behavior)")
 st.markdown("Changes to these widgets will update URL params with the prefix `p1_`.")
@@ -124,7 +119,7 @@ When you interact with this state, it will wipe out both `p1_` parameters and `?
 This demonstrates how multiple independent states can coexist: they "fight" for the URL focus, ensuring the URL is always clean and relevant to the most recently touched component.
 """)
 
-st.selectbox("Filter", ["all", "active", "completed"], key=AppState.bind_key("filter"))
+st.selectbox("Filter", ["all", "active", "completed"], **AppState.bind("filter"))
 st.number_input("Page", **AppState.bind("page"))
 
 st.caption(f"Current values: `filter`='{AppState.filter}', `page`={AppState.page}")
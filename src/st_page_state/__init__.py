@@ -1,6 +1,5 @@
 from .core.state import PageState
 from .core.var import StateVar
-from .backends.redis_backend import RedisBackend
 
 __all__ = [
     
@@ -11,3 +10,12 @@ __all__ = [
     # Redis
     "RedisBackend",
 ]
+
+def __getattr__(name):
+
+    # The Redis backend is imported on first access, so apps that never use it don't load it
+    if name == "RedisBackend":
+        from .backends.redis_backend import RedisBackend
+        return RedisBackend
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,59 @@
 import streamlit as st
+import hashlib
 import logging
 import threading
+import time
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from contextlib import contextmanager
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Collection, Dict, List, Optional, Tuple, Union
 
-from ..core.meta import _PAGE_STATE_REGISTRY, SESSION_STATE_KEY
-from ..utils.converters import deserialize_state, serialize_state
+try:
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+except ImportError:  # Streamlit build without the script-run context API
+    get_script_run_ctx = None
+
+from ..core.meta import _PAGE_STATE_REGISTRY, SESSION_STATE_KEY, VERSION_STATE_KEY
+from ..utils.converters import deserialize_state, serialize_state_bytes
 
 logger = logging.getLogger(__name__)
 
+# Marks zlib-compressed payloads (JSON text never starts with it, so uncompressed payloads stay readable)
+_COMPRESSED_MAGIC = b"z:"
+
+# Saved-version placeholder of a class whose last write failed (namespace versions start at 0)
+_UNSAVED = -1
+
+# Process-wide ``redis.StrictRedis`` clients, keyed by connection settings.
+# Every browser session builds its own RedisBackend, but sessions with the same
+# settings share one client, and so one connection pool.
+_CLIENTS: Dict[Tuple[Any, ...], Any] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+# Process-wide pool running the async saves of every session (threads are started on first use).
+# Its workers are not daemons: interpreter exit waits for in-flight saves, each bounded by the socket timeout.
+_SAVE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="st_page_state_save")
+
+
+def _holds_defaults(class_ns: Dict[str, Any], defaults: Dict[str, Any]) -> bool:
+    """Whether every field of *class_ns* still holds its default (same type and equal)."""
+
+    try:
+        for field, value in class_ns.items():
+            if field not in defaults:
+                return False
+
+            default = defaults[field]
+            if type(value) is not type(default) or value != default:
+                return False
+
+    # Values without a plain boolean equality (e.g. arrays) count as changed
+    except Exception:
+        return False
+
+    return True
+
 
 class RedisBackend:
     """Single entry-point for Redis-backed state persistence.
@@ -25,6 +70,14 @@ class RedisBackend:
     *key_prefix* — namespaces every Redis key as
     ``<prefix>:<session_id>:<ClassName>``.
 
+    *compress* — zlib-compress payloads before writing them.  Payloads
+    are read back whether compressed or not, so the flag can be turned on
+    for a store that already holds uncompressed keys.
+
+    *Connection sharing* — clients are cached per process by connection
+    settings, so every session with the same settings shares one
+    connection pool instead of opening its own sockets.
+
     *session_id* — controls how the current user is identified.
 
     * ``None`` (default) — uses the Streamlit session ID (ephemeral;
@@ -34,6 +87,17 @@ class RedisBackend:
       resolve the identity lazily, e.g.
       ``lambda: st.session_state.get("user_email", "anonymous")``.
 
+    *scan_count* — ``COUNT`` hint of each ``SCAN`` call in :meth:`load_all`.
+    Higher values mean fewer round-trips per load.
+
+    *socket_timeout* — seconds a Redis call may block (``None``: no limit).
+    Saves run on background threads that the interpreter waits for at exit,
+    so with ``None`` a hung Redis server can stall process shutdown.
+
+    *retry_interval* — seconds Redis calls are skipped after one fails.
+    While Redis is unreachable, reruns fall back to in-memory state right
+    away instead of each waiting for a connection timeout.
+
     **Identity transition** — when using a callable that changes its
     return value (e.g. ``"anonymous"`` → ``"juan@mail.com"`` after login),
     the in-memory session state is automatically cleared so the new
@@ -47,10 +111,24 @@ class RedisBackend:
     **Rerun-safe** — the instance is cached in ``st.session_state`` so
     that ``RedisBackend(...)`` at module level reuses the same object
     (and TCP connection) across Streamlit reruns.
+
+    **Dirty tracking** — a class is only written back when one of its
+    fields was assigned since the last save.  As with URL syncing,
+    mutate containers by re-assigning them (``State.tags = new_list``);
+    in-place changes such as ``State.tags.append(x)`` are not detected.
     """
 
     _INSTANCE_KEY = "_st_page_state_redis_backend"
 
+    # The instance lives in st.session_state for the whole session: no per-instance __dict__
+    __slots__ = (
+        "host", "port", "db", "password", "default_ttl", "key_prefix", "ssl", "socket_timeout",
+        "extra_kwargs", "scan_count", "compress", "retry_interval", "_session_id_resolver", "_client", "_initialized",
+        "_retry_at",
+        "_last_save_future", "_pending", "_pending_lock", "_flush_scheduled",
+        "_saved_versions", "_saved_digests", "_key_head_cache",
+    )
+
     def __new__(cls, *args: Any, **kwargs: Any):
         cached = st.session_state.get(cls._INSTANCE_KEY)
         if cached is not None:
@@ -71,13 +149,16 @@ class RedisBackend:
         default_ttl: Optional[int] = None,
         key_prefix: str = "st_page_state",
         ssl: bool = False,
-        socket_timeout: Optional[float] = None,
+        socket_timeout: Optional[float] = 5.0,
         session_id: Optional[Union[str, Callable[[], str]]] = None,
+        scan_count: int = 1000,
+        compress: bool = False,
+        retry_interval: float = 5.0,
         **kwargs: Any,
     ) -> None:
         
         # Already initialised — __new__ returned the cached instance
-        if st.session_state.get(self._INSTANCE_KEY) is self:
+        if getattr(self, "_initialized", False):
             return
 
         self.host = host
@@ -90,10 +171,31 @@ class RedisBackend:
         self.socket_timeout = socket_timeout
         self.extra_kwargs = kwargs
         self._session_id_resolver = session_id
-        self._last_save_thread: Optional[threading.Thread] = None
+        self.scan_count = scan_count
+        self.compress = compress
+        self.retry_interval = retry_interval
+        self._last_save_future: Optional[Future] = None
+
+        # Snapshots waiting for the next flush, last writer wins ({(session_id, class_name): (data, ttl, version)})
+        self._pending: Dict[Tuple[str, str], Tuple[Dict[str, Any], Optional[int], int]] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+
+        # Digest of the payload last written to each key ({key: digest}), to skip rewriting identical content
+        self._saved_digests: Dict[str, bytes] = {}
+
+        # Namespace version last handed to Redis, per class ({class_name: version}); _UNSAVED after a failed write
+        self._saved_versions: Dict[str, int] = {}
+
+        # Monotonic time before which Redis calls are skipped after a failure (0.0: Redis is reachable)
+        self._retry_at = 0.0
+
+        # (session_id, "<prefix>:<session_id>:") of the last session used to build keys
+        self._key_head_cache: Tuple[Optional[str], str] = (None, "")
 
         self._client = self._connect()
         st.session_state[self._INSTANCE_KEY] = self
+        self._initialized = True
 
         logger.debug(f"Redis configured – {host}:{port} db={db}")
 
@@ -109,21 +211,56 @@ class RedisBackend:
                 "Install it with:  pip install st-page-state[redis]"
             ) from exc
 
-        return _redis.StrictRedis(
+        settings = dict(
             host=self.host,
             port=self.port,
             db=self.db,
             password=self.password,
             ssl=self.ssl,
             socket_timeout=self.socket_timeout,
-            decode_responses=True,
+            decode_responses=False,
             **self.extra_kwargs,
         )
 
+        # Unhashable extra settings (e.g. an ssl context list) cannot be cached — build a private client
+        cache_key = tuple(sorted(settings.items()))
+        try:
+            hash(cache_key)
+
+        except TypeError:
+            return _redis.StrictRedis(**settings)
+
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(cache_key)
+            if client is None:
+                client = _CLIENTS[cache_key] = _redis.StrictRedis(**settings)
+
+        return client
+
+    # -- availability --------------------------------------------------------
+
+    def _unavailable(self) -> bool:
+        """Whether Redis calls are currently skipped, after a recent failure."""
+        return self._retry_at > 0.0 and time.monotonic() < self._retry_at
+
+    def _client_failed(self) -> None:
+        """Skip Redis calls for ``retry_interval`` seconds; the first call after that is the retry."""
+        self._retry_at = time.monotonic() + self.retry_interval
+
     # -- key / TTL -----------------------------------------------------------
 
+    def _key_head(self, session_id: str) -> str:
+        """``"<prefix>:<session_id>:"`` — formatted once per session id, not once per key."""
+
+        cached_sid, head = self._key_head_cache
+        if cached_sid != session_id:
+            head = f"{self.key_prefix}:{session_id}:"
+            self._key_head_cache = (session_id, head)
+
+        return head
+
     def _key(self, class_name: str, session_id: str) -> str:
-        return f"{self.key_prefix}:{session_id}:{class_name}"
+        return self._key_head(session_id) + class_name
 
     def resolve_ttl(self, state_cls) -> Optional[int]:
         """``Config.ttl`` on the class → ``default_ttl`` → ``None``."""
@@ -134,50 +271,121 @@ class RedisBackend:
         
         return self.default_ttl
 
+    # -- payloads ------------------------------------------------------------
+
+    def _encode(self, data: Dict[str, Any]) -> bytes:
+        """Serialize a namespace, compressing it when ``compress`` is enabled."""
+        return self._pack(serialize_state_bytes(data))
+
+    def _pack(self, payload: bytes) -> bytes:
+        """Compress a serialized namespace when ``compress`` is enabled."""
+
+        if self.compress:
+            return _COMPRESSED_MAGIC + zlib.compress(payload, 1)
+
+        return payload
+
+    @staticmethod
+    def _decode(raw: Union[str, bytes]) -> Dict[str, Any]:
+        """Deserialize a stored payload, compressed or not."""
+
+        if isinstance(raw, bytes) and raw.startswith(_COMPRESSED_MAGIC):
+            raw = zlib.decompress(raw[len(_COMPRESSED_MAGIC):])
+
+        return deserialize_state(raw)
+
     # -- CRUD ----------------------------------------------------------------
 
     def load(self, class_name: str, session_id: str) -> Optional[Dict[str, Any]]:
         key = self._key(class_name, session_id)
+        if self._unavailable():
+            return None
 
         try:
             raw = self._client.get(key)
-            return deserialize_state(raw) if raw is not None else None
+
+        except Exception as exc:
+            self._client_failed()
+            logger.warning(f"Redis load failed [{key}]: {exc}")
+            return None
+
+        self._retry_at = 0.0
+
+        try:
+            return self._decode(raw) if raw is not None else None
         
         except Exception as exc:
             logger.warning(f"Redis load failed [{key}]: {exc}")
             return None
 
-    def load_all(self, session_id: str) -> Dict[str, Dict[str, Any]]:
+    def load_all(self, session_id: str, skip: Collection[str] = ()) -> Dict[str, Dict[str, Any]]:
         """Load every class namespace stored for *session_id*.
 
-        Uses ``SCAN`` with the key pattern so no registry lookup is needed.
+        Uses ``SCAN`` (via ``scan_iter``) with the key pattern so no registry lookup is needed,
+        then fetches every matched key with a single ``MGET``. Classes named in *skip* are
+        left out of the ``MGET``.
         Returns ``{class_name: {field: value, ...}, ...}``.
         """
-        pattern = f"{self.key_prefix}:{session_id}:*"
-        prefix_len = len(f"{self.key_prefix}:{session_id}:")
+        key_head = self._key_head(session_id)
+        pattern = f"{key_head}*"
+        prefix_len = len(key_head)
         result: Dict[str, Dict[str, Any]] = {}
+        if self._unavailable():
+            return result
 
         try:
-            cursor = 0
-            while True:
-                cursor, keys = self._client.scan(cursor, match=pattern, count=100)
-                for key in keys:
-                    class_name = key[prefix_len:]
-                    data = self.load(class_name, session_id)
-                    if data:
-                        result[class_name] = data
-                if cursor == 0:
-                    break
+            keys = []
+            for key in self._client.scan_iter(match=pattern, count=self.scan_count):
+
+                # Keys come back as bytes (responses are not decoded, to keep payloads binary)
+                class_name = (key.decode() if isinstance(key, bytes) else key)[prefix_len:]
+                if class_name not in skip:
+                    keys.append((key, class_name))
+
+            raw_values = self._client.mget([key for key, _ in keys]) if keys else []
+
         except Exception as exc:
-            logger.warning(f"Redis scan failed [{pattern}]: {exc}")
+            self._client_failed()
+            logger.warning(f"Redis load failed [{pattern}]: {exc}")
+            return result
+
+        self._retry_at = 0.0
+
+        for (key, class_name), raw in zip(keys, raw_values):
+
+            # The key may have expired between SCAN and MGET
+            if raw is None:
+                continue
+
+            try:
+                data = self._decode(raw)
+
+            except Exception as exc:
+                logger.warning(f"Redis load failed [{key}]: {exc}")
+                continue
+
+            if data:
+                result[class_name] = data
 
         return result
 
     def save(self, class_name: str, session_id: str, data: Dict[str, Any], ttl: Optional[int]) -> None:
         key = self._key(class_name, session_id)
+        if self._unavailable():
+            logger.warning(f"Redis save skipped [{key}]: Redis unavailable")
+            return
+
         try:
+            payload = self._encode(data)
 
-            payload = serialize_state(data)
+        except Exception as exc:
+            logger.warning(f"Redis save failed [{key}]: {exc}")
+            return
+
+        # Written outside the save pool: the digest of the pool's last write no longer describes the key
+        self._saved_digests.pop(key, None)
+
+        try:
             if ttl:
                 self._client.setex(key, ttl, payload)
 
@@ -185,24 +393,62 @@ class RedisBackend:
                 self._client.set(key, payload)
 
         except Exception as exc:
+            self._client_failed()
             logger.warning(f"Redis save failed [{key}]: {exc}")
+            return
+
+        self._retry_at = 0.0
 
     def delete(self, class_name: str, session_id: str) -> None:
         key = self._key(class_name, session_id)
+        if self._unavailable():
+            logger.warning(f"Redis delete skipped [{key}]: Redis unavailable")
+            return
+
+        # A deleted key must be written in full by the next save
+        self._saved_digests.pop(key, None)
+
         try:
 
             self._client.delete(key)
 
         except Exception as exc:
+            self._client_failed()
             logger.warning(f"Redis delete failed [{key}]: {exc}")
+            return
+
+        self._retry_at = 0.0
 
     def ping(self) -> bool:
+        """Check the connection; a successful ping also ends any ``retry_interval`` wait."""
         try:
-            return bool(self._client.ping())
+            alive = bool(self._client.ping())
         
         except Exception:
             return False
 
+        if alive:
+            self._retry_at = 0.0
+
+        return alive
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until the background saves queued so far have been written.
+
+        Returns ``False`` if they are still running after *timeout* seconds.
+        """
+        future = self._last_save_future
+        if future is None:
+            return True
+
+        try:
+            future.result(timeout)
+
+        except FutureTimeoutError:
+            return False
+
+        return True
+
     # -- session context manager ---------------------------------------------
 
     @contextmanager
@@ -232,6 +478,8 @@ class RedisBackend:
 
             # Identity changed — clear all PageState namespaces
             st.session_state.pop(SESSION_STATE_KEY, None)
+            st.session_state.pop(VERSION_STATE_KEY, None)
+            self._saved_versions.clear()
             logger.debug(f"Identity changed ({prev_sid!r} → {sid!r}) — session state cleared")
 
         st.session_state[_SID_MARKER] = sid
@@ -241,41 +489,29 @@ class RedisBackend:
         #   1. Skip classes whose session_state namespace is already warm.
         #   2. Skip individual fields that have a URL query-param present
         #      (let _initialize_attribute's URL-first logic handle them).
-        existing = st.session_state.get(SESSION_STATE_KEY, {})
+        ns_root = st.session_state.setdefault(SESSION_STATE_KEY, {})
+        versions = st.session_state.get(VERSION_STATE_KEY, {})
 
         # Build a set of URL keys currently in the address bar
-        current_qp = set(st.query_params.keys()) if hasattr(st, "query_params") else set()
+        current_qp = frozenset(st.query_params.keys()) if hasattr(st, "query_params") else frozenset()
 
-        for class_name, fields in self.load_all(sid).items():
-            if class_name in existing and existing[class_name]:
-                continue  # session already warm for this class
+        # Classes already warm in this session are not fetched at all
+        warm = {class_name for class_name, class_ns in ns_root.items() if class_ns}
 
-            # Determine which URL keys belong to this class
-            cls_obj = _PAGE_STATE_REGISTRY.get(class_name)
-            url_fields = set()
-            if cls_obj is not None:
+        for class_name, fields in self.load_all(sid, skip=warm).items():
 
-                prefix = getattr(cls_obj, "_config", {}).get("url_prefix", "")
-                for meta in getattr(cls_obj, "_model_metadata", {}).values():
-
-                    uk = meta.get("url_key")
-                    if uk:
-
-                        url_fields.add(f"{prefix}{uk}")
-
-            # Filter out fields whose URL key is in query_params
-            if url_fields & current_qp:
+            # Filter out fields whose URL key is in query_params.
+            # Skipped outright when the URL is empty or holds none of this class's keys (set-to-set check).
+            cls_obj = _PAGE_STATE_REGISTRY.get(class_name)
+            if current_qp and cls_obj is not None and not current_qp.isdisjoint(cls_obj._own_url_keys):
 
                 # Only keep fields that do NOT have a URL override
-                field_meta = getattr(cls_obj, "_model_metadata", {}) if cls_obj else {}
+                field_url_keys = cls_obj._field_url_keys
                 filtered: dict = {}
 
                 for fname, fval in fields.items():
 
-                    meta = field_meta.get(fname, {})
-                    uk = meta.get("url_key")
-                    full_uk = f"{prefix}{uk}" if uk else None
-
+                    full_uk = field_url_keys.get(fname)
                     if full_uk and full_uk in current_qp:
 
                         logger.debug(f"Skipping '{class_name}.{fname}' — URL param '{full_uk}' takes precedence")
@@ -284,11 +520,15 @@ class RedisBackend:
                     filtered[fname] = fval
                 fields = filtered
 
+            # The class has a key, even when the URL overrides every stored field: a later
+            # write of its default values must reach Redis instead of being skipped as fresh
+            self._saved_versions[class_name] = versions.get(class_name, 0)
+
             if not fields:
                 continue
 
-            st.session_state.setdefault(SESSION_STATE_KEY, {}).setdefault(class_name, {})
-            st.session_state[SESSION_STATE_KEY][class_name].update(fields)
+            # The namespace now matches Redis — nothing to write back until it changes
+            ns_root.setdefault(class_name, {}).update(fields)
 
             logger.debug(f"Restored {len(fields)} field(s) for '{class_name}' from Redis (session={sid})")
 
@@ -315,9 +555,11 @@ class RedisBackend:
             return resolver()
 
         # Fallback: Streamlit runtime session ID
+        if get_script_run_ctx is None:
+            return "default"
+
         try:
 
-            from streamlit.runtime.scriptrunner import get_script_run_ctx
             ctx = get_script_run_ctx()
 
             if ctx is not None:
@@ -328,28 +570,191 @@ class RedisBackend:
         return "default"
 
     def _save(self, session_id: str) -> None:
-        """Snapshot every class namespace and persist in a daemon thread."""
+        """Snapshot every changed class namespace and queue it for the background save pool.
+
+        Snapshots replace any still-pending snapshot of the same class, so reruns
+        arriving faster than Redis absorbs them collapse into one write per class.
+        """
         all_ns = st.session_state.get(SESSION_STATE_KEY, {})
-        payloads: List[Tuple[str, Dict[str, Any], Optional[int]]] = []
+        versions = st.session_state.get(VERSION_STATE_KEY, {})
+        payloads: Dict[Tuple[str, str], Tuple[Dict[str, Any], Optional[int], int]] = {}
 
         for class_name, class_ns in all_ns.items():
             if not class_ns:
                 continue
 
-            # Resolve TTL from the registry if the class is known, else use global default
+            # Skip namespaces that have not been written to since the last save
+            version = versions.get(class_name, 0)
+            if self._saved_versions.get(class_name) == version:
+                continue
+
+            # Sessions start by seeding every field with its default: a class that was neither loaded
+            # from nor written to Redis yet and still holds only defaults has nothing worth storing
             state_cls = _PAGE_STATE_REGISTRY.get(class_name)
+            known = class_name in self._saved_versions
+            self._saved_versions[class_name] = version
+
+            if not known and state_cls is not None and _holds_defaults(class_ns, state_cls._defaults):
+                logger.debug(f"Skipped '{class_name}' — only default values (session={session_id})")
+                continue
+
+            # Resolve TTL from the registry if the class is known, else use global default
             ttl = self.resolve_ttl(state_cls) if state_cls else self.default_ttl
 
-            payloads.append((class_name, dict(class_ns), ttl))
+            payloads[(session_id, class_name)] = (dict(class_ns), ttl, version)
+
+        if not payloads:
+            return
 
-        if payloads:
+        with self._pending_lock:
+            self._pending.update(payloads)
 
-            t = threading.Thread(target=self._save_worker, args=(session_id, payloads), daemon=True)
-            t.start()
-            self._last_save_thread = t
+            # A flush already queued or running will pick these snapshots up
+            if self._flush_scheduled:
+                return
 
-    def _save_worker(self, session_id: str, payloads: "List[Tuple[str, Dict[str, Any], Optional[int]]]") -> None:
-        for class_name, data, ttl in payloads:
-            self.save(class_name, session_id, data, ttl)
+            self._flush_scheduled = True
+            self._last_save_future = _SAVE_EXECUTOR.submit(self._flush_pending)
+
+    def _flush_pending(self) -> None:
+        """Write pending snapshots until none are left.
+
+        Only one flush per backend runs at a time: snapshots queued while a batch is
+        being written are picked up by the same flush afterwards, instead of a second
+        flush racing it on the other pool worker. Writes therefore reach Redis in order.
+
+        An unexpected error ends the flush instead of leaving it marked as running:
+        the snapshots it held are marked unsaved, and the next ``_save`` reschedules them.
+        """
+        while True:
+            with self._pending_lock:
+                batch, self._pending = self._pending, {}
+
+                if not batch:
+                    self._flush_scheduled = False
+                    return
+
+            try:
+                self._save_worker(batch)
+
+            except Exception as exc:
+                logger.exception(f"Redis save failed unexpectedly: {exc}")
+
+                with self._pending_lock:
+                    batch.update(self._pending)
+                    self._pending = {}
+                    self._flush_scheduled = False
+
+                for (_, class_name), (_, _, version) in batch.items():
+                    self._mark_unsaved(class_name, version)
+                return
+
+    def _mark_unsaved(self, class_name: str, version: int) -> None:
+        """Forget that *version* of a class reached Redis, so the next ``_save`` sends it again.
+
+        The class stays known: a write of its default values is retried too. A newer
+        version recorded meanwhile is left alone, its own snapshot is already queued.
+        """
+        if self._saved_versions.get(class_name) == version:
+            self._saved_versions[class_name] = _UNSAVED
+
+    def _save_worker(self, batch: Dict[Tuple[str, str], Tuple[Dict[str, Any], Optional[int], int]]) -> None:
+        """Write every snapshot in one pipelined round-trip, logging failures per class.
+
+        Snapshots whose serialized content matches what was last written to their
+        key (e.g. a list re-assigned with equal items) are not sent again; keys with
+        a TTL only get their expiry refreshed, and are written in full by a second
+        round-trip if that refresh finds the key gone. Snapshots that did not reach
+        Redis are marked unsaved and go out again with the next save.
+        """
+        entries: List[Tuple[str, str, Dict[str, Any], Optional[int], int, bytes, bytes]] = []
+        sessions = sorted({session_id for session_id, _ in batch})
+
+        if self._unavailable():
+            for (_, class_name), (_, _, version) in batch.items():
+                self._mark_unsaved(class_name, version)
+            logger.warning(f"Redis save skipped [session={', '.join(sessions)}]: Redis unavailable")
+            return
+
+        for (session_id, class_name), (data, ttl, version) in batch.items():
+            try:
+                payload = serialize_state_bytes(data)
+
+            except Exception as exc:
+                logger.warning(f"Redis save failed [{self._key(class_name, session_id)}]: {exc}")
+                continue
+
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
+            entries.append((session_id, class_name, data, ttl, version, payload, digest))
+
+        # Keys found missing by EXPIRE lose their digest, so the next pass sends their payload
+        while entries:
+            entries = self._write_entries(entries)
+
+    def _write_entries(
+        self, entries: List[Tuple[str, str, Dict[str, Any], Optional[int], int, bytes, bytes]]
+    ) -> List[Tuple[str, str, Dict[str, Any], Optional[int], int, bytes, bytes]]:
+        """Send serialized snapshots in one pipeline; return those whose expiry refresh found no key."""
+        queued: List[Tuple[str, str, Dict[str, Any], Optional[int], int, bytes, bytes]] = []
+        vanished: List[Tuple[str, str, Dict[str, Any], Optional[int], int, bytes, bytes]] = []
+
+        try:
+
+            pipe = self._client.pipeline(transaction=False)
+            for entry in entries:
+                session_id, class_name, _, ttl, _, payload, digest = entry
+                key = self._key(class_name, session_id)
+
+                # Same content as the last successful write — only keep the key alive
+                if self._saved_digests.get(key) == digest:
+                    if not ttl:
+                        logger.debug(f"Skipped unchanged '{class_name}' (session={session_id})")
+                        continue
+
+                    pipe.expire(key, ttl)
+
+                elif ttl:
+                    pipe.setex(key, ttl, self._pack(payload))
+
+                else:
+                    pipe.set(key, self._pack(payload))
+
+                queued.append(entry)
+
+            # Failed commands come back as exception objects instead of aborting the batch
+            results = pipe.execute(raise_on_error=False) if queued else []
+
+        except Exception as exc:
+            self._client_failed()
+            sessions = sorted({entry[0] for entry in entries})
+            for _, class_name, _, _, version, _, _ in entries:
+                self._mark_unsaved(class_name, version)
+            logger.warning(f"Redis save failed [session={', '.join(sessions)}]: {exc}")
+            return vanished
+
+        if queued:
+            self._retry_at = 0.0
+
+        for entry, result in zip(queued, results):
+            session_id, class_name, data, ttl, version, _, digest = entry
+            key = self._key(class_name, session_id)
+            if isinstance(result, Exception):
+
+                # Unknown state on the server — make sure the next save is sent
+                self._saved_digests.pop(key, None)
+                self._mark_unsaved(class_name, version)
+                logger.warning(f"Redis save failed [{key}]: {result}")
+                continue
+
+            # EXPIRE found no key (expired or deleted meanwhile) — rewrite it in full
+            if result is False:
+                self._saved_digests.pop(key, None)
+                vanished.append(entry)
+                logger.debug(f"Key vanished before its expiry refresh, rewriting it [{key}]")
+                continue
+
+            self._saved_digests[key] = digest
 
             logger.debug(f"Saved {len(data)} field(s) for '{class_name}' (session={session_id}, ttl={ttl})")
+
+        return vanished
@@ -1,11 +1,16 @@
 import streamlit as st
 from typing import Any
 import copy
+import datetime
 import logging
+import sys
+import threading
+from contextlib import contextmanager
+from types import MappingProxyType
 
 from .var import StateVar
 from ..errors import InvalidQueryParamError
-from ..utils.converters import convert_from_URL, convert_to_URL
+from ..utils.converters import convert_to_URL, make_URL_decoder
 
 # Basic logger setup
 logger = logging.getLogger(__name__)
@@ -13,9 +18,106 @@ logger = logging.getLogger(__name__)
 # Constant for the session state key used to store page state data
 SESSION_STATE_KEY = "_st_page_state"
 
+# Session state key of the per-class write counters ({class_name: version}), used to detect changed namespaces
+VERSION_STATE_KEY = "_st_page_state_versions"
+
 # Registry to track all PageState classes
 _PAGE_STATE_REGISTRY = {}
 
+# Registry routing each full URL key (prefix included) to the fields reading it: {url_key: {class_name: field}}
+_URL_KEY_REGISTRY = {}
+
+# Immutable value types whose equal values can be skipped on write and reset (containers are always written)
+_IMMUTABLE_TYPES = frozenset({str, int, float, bool, type(None), datetime.date, datetime.datetime, datetime.time})
+
+def _keep(value: Any) -> Any:
+    """Copier of immutable defaults: they can be shared as they are."""
+    return value
+
+def _default_copier(default: Any):
+    """
+    Picks the cheapest copy function of a default that still shares no mutable state with it.
+    Immutable values are shared, flat containers of immutable items get a shallow copy, anything else a deep copy.
+    """
+
+    default_type = type(default)
+    if default_type in _IMMUTABLE_TYPES:
+        return _keep
+
+    if default_type in (tuple, frozenset, list, set, dict):
+        items = default.values() if default_type is dict else default
+
+        if all(type(item) in _IMMUTABLE_TYPES for item in items):
+            return _keep if default_type in (tuple, frozenset) else default_type.copy
+
+    return copy.deepcopy
+
+# Query params staged by the URL operation running on this thread (see `_staged_query_params`)
+_QUERY_PARAMS_STAGE = threading.local()
+
+def _current_query_params():
+    """The query params staged by the running URL operation, or `st.query_params` outside of one."""
+
+    staged = getattr(_QUERY_PARAMS_STAGE, "params", None)
+    return st.query_params if staged is None else staged
+
+def _commit_query_params(original: dict, staged: dict):
+    """
+    Applies the keys a URL operation changed to `st.query_params`, in a single URL update.
+
+    A single changed key is set or deleted in place. Several go through one `from_dict` call,
+    where the keys the operation left alone are written back with all their values, so
+    repeated params (`?tag=a&tag=b`) and keys managed by other code come through unchanged.
+    """
+
+    removed = [key for key in original if key not in staged]
+    changed = {key: value for key, value in staged.items() if key not in original or original[key] != value}
+
+    if len(removed) + len(changed) == 1:
+        if removed:
+            del st.query_params[removed[0]]
+
+        else:
+            key, value = changed.popitem()
+            st.query_params[key] = value
+
+        return
+
+    query_params = st.query_params
+    query_params.from_dict({
+        key: value if key in changed else query_params.get_all(key)
+        for key, value in staged.items()
+    })
+
+@contextmanager
+def _staged_query_params():
+    """
+    Stages the URL query params in a plain dict for the duration of a URL operation.
+
+    Reads and writes go to the staged dict, whose changes are committed to `st.query_params`
+    on exit with `_commit_query_params` (and only if there are any), so Streamlit pushes one
+    URL update to the frontend instead of one per deleted or written key.
+    Nested operations (e.g. a restore triggered while syncing) share the outermost stage.
+    """
+
+    # Re-entrant: join the stage opened by an outer operation
+    staged = getattr(_QUERY_PARAMS_STAGE, "params", None)
+    if staged is not None:
+        yield staged
+        return
+
+    original = dict(st.query_params)
+    staged = _QUERY_PARAMS_STAGE.params = dict(original)
+
+    try:
+        yield staged
+    finally:
+        _QUERY_PARAMS_STAGE.params = None
+
+        # Commit once, if anything changed
+        if staged != original:
+            _commit_query_params(original, staged)
+
 class PageStateMeta(type):
     """
     Metaclass for managing Streamlit session state and URL query parameters.
@@ -76,6 +178,9 @@ class PageStateMeta(type):
         
         # Register the class
         _PAGE_STATE_REGISTRY[name] = cls
+
+        # Per-class cache of widget bindings, filled lazily by `PageState.bind`
+        cls._bind_cache = {}
         
         # ---
         # 3. Config class Processing
@@ -104,6 +209,9 @@ class PageStateMeta(type):
         if not hasattr(cls, '_model_metadata'):
             cls._model_metadata = {}
 
+        # Reversed value maps of the fields, used to read URL values ({field: {url_value: internal_value}})
+        cls._reverse_value_maps = {}
+
         # ---
         # Scan for StateVar attributes
         
@@ -125,6 +233,7 @@ class PageStateMeta(type):
                     "value_map": attr_value.value_map,
                     "dtype": attr_type
                 }
+                cls._reverse_value_maps[attr_name] = attr_value._reverse_value_map
                 
                 # Remove the StateVar attribute from the class
                 # This ensures that accessing Class.Attr triggers PageStateMeta.__getattr__,
@@ -132,6 +241,65 @@ class PageStateMeta(type):
                 if hasattr(cls, attr_name):
                     delattr(cls, attr_name)
 
+        # Read-only view over the metadata, returned by `PageState.schema()`
+        cls._schema = MappingProxyType(cls._model_metadata)
+
+        # ---
+        # 5. URL key routing
+
+        # Full URL key (prefix included) of every URL-synced field
+        prefix = cls._config["url_prefix"]
+        cls._field_url_keys = {
+            field: f"{prefix}{metadata['url_key']}"
+            for field, metadata in cls._model_metadata.items() if metadata.get("url_key")
+        }
+
+        # Set of those keys, used to tell this class's query params from foreign ones
+        cls._own_url_keys = frozenset(cls._field_url_keys.values())
+
+        # Own keys plus the shared classes' keys, resolved on first use (see `_allowed_url_keys`)
+        cls._allowed_url_keys_cache = None
+
+        # URL value converter of each URL-synced field, with its type dispatch resolved once
+        cls._url_decoders = {
+            field: make_URL_decoder(
+                field, cls._model_metadata[field].get("dtype"), cls._model_metadata[field].get("value_map"), cls._reverse_value_maps.get(field)
+            )
+            for field in cls._field_url_keys
+        }
+
+        # Register them so `PageState.hydrate_all` can route query params with one lookup
+        for field, full_url_key in cls._field_url_keys.items():
+            _URL_KEY_REGISTRY.setdefault(full_url_key, {})[name] = field
+
+        # Widget key of every field, used by `PageState.bind`.
+        # Interned so the `st.session_state` lookups on each rerun compare by identity.
+        cls._widget_keys = {
+            field: sys.intern(f"{name}_{field}_widget") for field in cls._model_metadata
+        }
+
+        # ---
+        # 6. Default snapshots, used by `PageState.reset()` to reset every field in one pass
+
+        cls._defaults = {field: metadata["default"] for field, metadata in cls._model_metadata.items()}
+
+        # Copy function of each default ({field: copier}), see `_fresh_default`
+        cls._default_copiers = {field: _default_copier(default) for field, default in cls._defaults.items()}
+
+        # URL value of each default ({full_url_key: url_value}); None marks params to remove
+        cls._url_defaults = {}
+        for field, full_url_key in cls._field_url_keys.items():
+            default = cls._defaults[field]
+
+            if default is None:
+                cls._url_defaults[full_url_key] = None if cls._config["ignore_none_url"] else ""
+            else:
+                cls._url_defaults[full_url_key] = convert_to_URL(field, default, cls._model_metadata[field].get("value_map"))
+
+        # Resolve "restore URL on touch" once: a class without URL-synced fields has nothing to restore,
+        # so reads and writes on it skip the URL logic entirely.
+        cls._restore_on_touch = bool(cls._config["restore_url_on_touch"] and cls._field_url_keys)
+
     # ---
     # Attribute access method, handles: value = Class.attribute
     def __getattr__(cls, key):
@@ -147,16 +315,13 @@ class PageStateMeta(type):
             # 2. Getting the attribute from session state
 
             # Ensuring the system and class namespaces on session state are defined
-            cls._ensure_storage()
-            
-            # Getting the class namespace on session state
-            class_ns = st.session_state[SESSION_STATE_KEY][cls.__name__]
+            class_ns = cls._namespace()
 
             # If the attribute is already in session state, return it
             if key in class_ns:
                 
                 # 3. "Restore URL on touch" feature
-                if cls._config.get("restore_url_on_touch"):
+                if cls._restore_on_touch:
                     cls._restore_url()
                     
                 return class_ns[key]
@@ -182,10 +347,7 @@ class PageStateMeta(type):
             # 2. Setting the attribute on session state
 
             # Ensuring the system and class namespaces on session state are defined
-            cls._ensure_storage()
-            
-            # Getting the class namespace on session state
-            class_ns = st.session_state[SESSION_STATE_KEY][cls.__name__]
+            class_ns = cls._namespace()
 
             # Hook: If the child class has "before_set" method, calls it
             if hasattr(cls, "before_set"):
@@ -194,17 +356,25 @@ class PageStateMeta(type):
             # Getting the old value, to use later on "on_change" hook
             old_value = class_ns.get(key)
 
-            # Setting the value directly on the class session state namespace
-            class_ns[key] = value
+            # Setting the value directly on the class session state namespace.
+            # Re-writing an equal immutable value is skipped, so the namespace is not marked as changed.
+            value_type = type(value)
+            if not (key in class_ns and value_type is type(old_value) and value_type in _IMMUTABLE_TYPES and old_value == value):
+                class_ns[key] = value
+                cls._bump_version()
             
-            # ---
-            # 3. Url Syncing
-            cls._sync_url(key, value)
+            # Both URL steps below share one staged query params update
+            with _staged_query_params():
 
-            # ---
-            # 4. "Restore URL on touch" feature
-            if cls._config.get("restore_url_on_touch"):
-                cls._restore_url()
+                # ---
+                # 3. Url Syncing (only fields with a url_key touch the URL)
+                if key in cls._field_url_keys:
+                    cls._sync_url(key, value)
+
+                # ---
+                # 4. "Restore URL on touch" feature
+                if cls._restore_on_touch:
+                    cls._restore_url()
 
             # ---
             # Hook: If the child class has "on_change" method, calls it
@@ -218,20 +388,91 @@ class PageStateMeta(type):
     # ---
     # Internals
 
-    def _ensure_storage(cls):
+    def _namespace(cls) -> dict:
+        """
+        The class namespace on session state, defined on first use (firing `on_init`).
+        Resolved with one lookup per level instead of a membership test followed by indexing.
+        """
 
         # Ensure the system namespace on session state are defined
-        if SESSION_STATE_KEY not in st.session_state:
-            st.session_state[SESSION_STATE_KEY] = {}
+        root = st.session_state.get(SESSION_STATE_KEY)
+        if root is None:
+            root = st.session_state[SESSION_STATE_KEY] = {}
 
         # Ensure the class namespace on session state are defined
-        if cls.__name__ not in st.session_state[SESSION_STATE_KEY]:
-            st.session_state[SESSION_STATE_KEY][cls.__name__] = {}
+        class_ns = root.get(cls.__name__)
+        if class_ns is None:
+            class_ns = root[cls.__name__] = {}
 
             # Hook: if the child class has an "on_init" method, calls it.
             if hasattr(cls, 'on_init'):
                 cls.on_init()
 
+        return class_ns
+
+    def _bump_version(cls):
+        """Marks the class namespace on session state as changed."""
+
+        versions = st.session_state.setdefault(VERSION_STATE_KEY, {})
+        versions[cls.__name__] = versions.get(cls.__name__, 0) + 1
+
+    def _reset_all(cls):
+        """
+        Resets every field to its default in a single pass.
+        Equivalent to setting each field to its default, with one namespace update and one URL update.
+        """
+
+        # Ensuring the system and class namespaces on session state are defined
+        class_ns = cls._namespace()
+
+        # Hook: If the child class has "before_set" method, calls it
+        if hasattr(cls, "before_set"):
+            cls.before_set()
+
+        # Old values, to use later on "on_change" hook
+        old_values = dict(class_ns)
+
+        # Setting every default at once, using copies to avoid shared references.
+        # Fields already holding an equal immutable default are skipped, as in `__setattr__`.
+        defaults = cls._defaults
+        changes = {}
+        for field, default in defaults.items():
+            default_type = type(default)
+            if field in class_ns and default_type in _IMMUTABLE_TYPES and type(class_ns[field]) is default_type and class_ns[field] == default:
+                continue
+
+            changes[field] = cls._fresh_default(field)
+
+        if changes:
+            class_ns.update(changes)
+            cls._bump_version()
+
+        # ---
+        # URL Syncing
+        if cls._field_url_keys:
+            with _staged_query_params() as query_params:
+
+                # Handle Selfishness
+                if cls._config["url_selfish"]:
+                    cls._enforce_selfishness()
+
+                # Write the precomputed URL values of the defaults
+                for full_url_key, url_value in cls._url_defaults.items():
+                    if url_value is not None:
+                        query_params[full_url_key] = url_value
+
+                    else:
+                        query_params.pop(full_url_key, None)
+
+        # ---
+        # Hook: If the child class has "on_change" method, calls it for every changed field
+        if hasattr(cls, "on_change"):
+            for field, old_value in old_values.items():
+                new_value = class_ns[field]
+
+                if old_value and old_value != new_value:
+                    cls.on_change(field, old_value, new_value)
+
     def _initialize_attribute(cls, field: str) -> Any:
         """
         Lazy initialization of a state attribute.
@@ -239,33 +480,17 @@ class PageStateMeta(type):
         Sets the result in state (via __setattr__) to persist it.
         """
 
-        # Extracts the field metadata
-        metadata = cls._model_metadata.get(field)
-        
-        url_key = metadata.get("url_key")
-        value_map = metadata.get("value_map")
-        default = metadata.get("default")
-        dtype = metadata.get("dtype")
+        full_url_key = cls._field_url_keys.get(field)
 
         # ---
         # First declaring of the final value to set on state for this attribute
         final_value = None
         
-        # Try to load from URL Query Params
-        if url_key and url_key in st.query_params:
+        # Try to load from URL Query Params (the staged ones, if a URL operation is running)
+        query_params = _current_query_params()
 
-            # Gets the string value returned from the URL
-            url_value = st.query_params[url_key]
-            
-            try:
-                # Convert from URL string to internal Python object
-                final_value = convert_from_URL(field, url_value, dtype, value_map)
-
-            except InvalidQueryParamError as invalid_qp:
-                logger.error(
-                    f"There was an error parsing the URL-value '{url_value}' from URL-key '{url_key}' of the state attribute '{field}'." \
-                    f"Falling back to default value '{default}'. Error: {invalid_qp}"
-                )
+        if full_url_key and full_url_key in query_params:
+            final_value = cls._value_from_url(field, query_params[full_url_key])
             
         # ---
         # Decide value (URL takes precedence over default)
@@ -274,8 +499,8 @@ class PageStateMeta(type):
         # If URL did not provide a value, use a copy of default
         if value_to_set is None:
 
-            # Using deep copy to avoid shared references
-            value_to_set = copy.deepcopy(default)
+            # Using a copy to avoid shared references
+            value_to_set = cls._fresh_default(field)
         
         # ---
         # Set it (triggers __setattr__, which updates session state and URL)
@@ -284,51 +509,72 @@ class PageStateMeta(type):
         # Return the initialized value
         return value_to_set
 
-    def _sync_url(cls, key: str, value: Any):
+    def _fresh_default(cls, field: str) -> Any:
         """
-        Synchronizes the URL query parameters with the given attribute value.
+        Returns a copy of the default of a state attribute, safe to store and mutate.
+        Uses the copy function picked at class creation instead of a deep copy on every call.
+        """
+        return cls._default_copiers[field](cls._defaults[field])
+
+    def _value_from_url(cls, field: str, url_value: str) -> Any:
+        """
+        Converts a URL query param value to the internal value of a state attribute.
+        Returns None (and logs the error) if the value cannot be parsed.
         """
 
         # Extracts the field metadata
-        metadata = cls._model_metadata.get(key)
+        metadata = cls._model_metadata.get(field)
+
+        try:
+            # Convert from URL string to internal Python object
+            return cls._url_decoders[field](url_value)
+
+        except InvalidQueryParamError as invalid_qp:
+            logger.error(
+                f"There was an error parsing the URL-value '{url_value}' from URL-key '{cls._field_url_keys.get(field)}' of the state attribute '{field}'." \
+                f"Falling back to default value '{metadata.get('default')}'. Error: {invalid_qp}"
+            )
+            return None
+
+    def _sync_url(cls, key: str, value: Any):
+        """
+        Synchronizes the URL query parameters with the given attribute value.
+        """
 
-        url_key = metadata.get("url_key")
-        value_map = metadata.get("value_map")
+        # Full URL key (prefix included), precomputed by the metaclass
+        final_url_key = cls._field_url_keys.get(key)
 
         # If URL syncing is not configured for this attribute, skip
-        if not url_key:
+        if not final_url_key:
             return
-        
-        # Apply prefix from Config
-        prefix = cls._config.get("url_prefix", "")
-        final_url_key = f"{prefix}{url_key}"
 
-        # 1. Handle Selfishness
-        if cls._config.get("url_selfish"):
-            cls._enforce_selfishness()
+        config = cls._config
 
-        # ---
-        # 2. Handle None values based on Config
-        if value is None:
+        with _staged_query_params() as query_params:
 
-            # If configured to ignore None values in URL, remove the param
-            if cls._config.get("ignore_none_url"):
+            # 1. Handle Selfishness
+            if config["url_selfish"]:
+                cls._enforce_selfishness()
 
-                if final_url_key in st.query_params:
-                    del st.query_params[final_url_key]
+            # ---
+            # 2. Handle None values based on Config
+            if value is None:
 
-                return
-            
-            else:
-                # If not ignoring None, we can represent it as an empty string
-                value = ""
-        
-        # ---
-        # 4. Convert the internal value to URL string
-        url_value = convert_to_URL(key, value, value_map)
+                # If configured to ignore None values in URL, remove the param
+                if config["ignore_none_url"]:
+                    query_params.pop(final_url_key, None)
+                    return
+
+                else:
+                    # If not ignoring None, we can represent it as an empty string
+                    value = ""
 
-        # 5. Update the URL query parameters
-        st.query_params[final_url_key] = url_value
+            # ---
+            # 4. Convert the internal value to URL string
+            url_value = convert_to_URL(key, value, cls._model_metadata[key].get("value_map"))
+
+            # 5. Update the URL query parameters
+            query_params[final_url_key] = url_value
 
     # ---
     # URL Selfishness and Restoration
@@ -358,9 +604,11 @@ class PageStateMeta(type):
             # URL will become ?my_param=123 (assuming url_selfish=True)
             ```
         """
-        
-        cls._enforce_selfishness()
-        cls._restore_url()
+
+        # One URL update for both steps
+        with _staged_query_params():
+            cls._enforce_selfishness()
+            cls._restore_url()
 
     def _restore_url(cls):
         """
@@ -378,70 +626,94 @@ class PageStateMeta(type):
         if getattr(cls, "_is_restoring_url", False):
             return
 
+        # Fast path (the common case on reads): every URL-synced field is initialized and its parameter
+        # is in the URL, or left out on purpose for a None value with `ignore_none_url`
+        current_query_params = _current_query_params()
+        class_ns = cls._namespace()
+        ignore_none = cls._config["ignore_none_url"]
+        if all(
+            field in class_ns and (url_key in current_query_params or (ignore_none and class_ns[field] is None))
+            for field, url_key in cls._field_url_keys.items()
+        ):
+            return
+
         # Mark that we are restoring URL to avoid recursion
         cls._is_restoring_url = True
-        
+
         try:
-            prefix = cls._config.get("url_prefix", "")
+            with _staged_query_params() as query_params:
 
-            # Iterate over all defined state variables
-            for field, metadata in cls._model_metadata.items():
-                
-                url_key = metadata.get("url_key")
-                if not url_key:
-                    continue
-                    
-                value = getattr(cls, field)
-                value_map = metadata.get("value_map")
+                # Loop invariants
+                metadata = cls._model_metadata
 
-                # Handle None values
-                if value is None:
-                    if cls._config.get("ignore_none_url"):
+                # Iterate over the URL-synced state variables
+                for field, final_url_key in cls._field_url_keys.items():
+
+                    # Read the value from session state, lazily initializing it if needed: a field
+                    # seeded now still gets its deep-link param, before another selfish class strips it
+                    value = class_ns[field] if field in class_ns else getattr(cls, field)
+
+                    # Restore the URL parameter only if it's missing
+                    if final_url_key in query_params:
                         continue
-                    else:
-                        value = ""
 
-                # Restore the URL parameter only if it's missing
-                final_url_key = f"{prefix}{url_key}"
-                if final_url_key not in st.query_params:
-                    url_value = convert_to_URL(field, value, value_map)
-                    st.query_params[final_url_key] = url_value
-        
+                    # Handle None values
+                    if value is None:
+                        if ignore_none:
+                            continue
+                        else:
+                            value = ""
+
+                    # The lazy initialization above may have written it already
+                    if final_url_key not in query_params:
+                        query_params[final_url_key] = convert_to_URL(field, value, metadata[field].get("value_map"))
+
         finally:
             # Unmark the restoring flag
             cls._is_restoring_url = False
 
-    def _enforce_selfishness(cls):
-        """Removes URL parameters not belonging to this class (or shared classes) if url_selfish is True."""
-        prefix = cls._config.get("url_prefix", "")
-        
-        # Collect all allowed keys for this class
-        allowed_keys = {
-            f"{prefix}{m['url_key']}"
-            for m in cls._model_metadata.values() if m.get("url_key")
-        }
-        
+    @property
+    def _allowed_url_keys(cls) -> frozenset:
+        """
+        URL keys a selfish write keeps: this class's own keys plus those of the classes in `share_url_with`.
+        Memoized once every shared class is resolved; a shared class named by string and not defined yet
+        is resolved again on the next call.
+        """
+
+        cached = cls._allowed_url_keys_cache
+        if cached is not None:
+            return cached
+
+        allowed_keys = cls._own_url_keys
+        resolved = True
+
         # Add allowed keys from shared classes
         shared_classes = cls._config.get("share_url_with", [])
         for shared_item in shared_classes:
             shared_cls = None
-            
+
             # Resolve shared item (could be class or string name)
             if isinstance(shared_item, type):
                 shared_cls = shared_item
             elif isinstance(shared_item, str):
                 shared_cls = _PAGE_STATE_REGISTRY.get(shared_item)
 
-            if shared_cls and hasattr(shared_cls, '_model_metadata'):
-                shared_prefix = getattr(shared_cls, '_config', {}).get("url_prefix", "")
-                
-                shared_keys = {
-                    f"{shared_prefix}{m['url_key']}"
-                    for m in shared_cls._model_metadata.values() if m.get("url_key")
-                }
-                allowed_keys.update(shared_keys)
+            if shared_cls and hasattr(shared_cls, '_own_url_keys'):
+                allowed_keys = allowed_keys | shared_cls._own_url_keys
+            else:
+                resolved = False
+
+        if resolved:
+            cls._allowed_url_keys_cache = allowed_keys
+
+        return allowed_keys
+
+    def _enforce_selfishness(cls):
+        """Removes URL parameters not belonging to this class (or shared classes) if url_selfish is True."""
+
+        allowed_keys = cls._allowed_url_keys
 
-        # Remove extra keys
-        for k in list(st.query_params.keys()):
-            if k not in allowed_keys:
-                del st.query_params[k]
\ No newline at end of file
+        # Remove extra keys, classified in one pass with set lookups
+        with _staged_query_params() as query_params:
+            for k in [k for k in query_params if k not in allowed_keys]:
+                del query_params[k]
\ No newline at end of file
@@ -1,7 +1,31 @@
 import streamlit as st
 from typing import Any
 
-from .meta import PageStateMeta, SESSION_STATE_KEY
+from .meta import PageStateMeta, SESSION_STATE_KEY, _PAGE_STATE_REGISTRY, _URL_KEY_REGISTRY
+from ..utils.converters import convert_to_URL
+
+class _BindCallback:
+    """
+    Widget `on_change` callback produced by `PageState.bind`.
+
+    A small callable object instead of a closure, so it can be built once per
+    (class, field) and reused on every rerun.
+    """
+
+    __slots__ = ("state_cls", "field", "widget_key")
+
+    def __init__(self, state_cls, field: str, widget_key: str):
+        self.state_cls = state_cls
+        self.field = field
+        self.widget_key = widget_key
+
+    def __call__(self):
+
+        # Gets the new value from session state
+        new_value = st.session_state.get(self.widget_key)
+
+        # Updates the state variable using setattr (triggers __setattr__ in the metaclass, which updates session state and URL)
+        setattr(self.state_cls, self.field, new_value)
 
 class PageState(metaclass=PageStateMeta):
     """
@@ -14,35 +38,121 @@ class PageState(metaclass=PageStateMeta):
 
     @classmethod
     def schema(cls):
-        """Returns the metadata definition of the state."""
+        """Returns a read-only view of the metadata definition of the state."""
+
+        return cls._schema
+
+    @classmethod
+    def url_value_for(cls, field: str, value: Any) -> str:
+        """
+        Returns the URL string that `value` is written as for the given field.
 
-        return cls._model_metadata
+        Applies the field's `value_map`, so for a mapped field this is the friendly
+        URL value (e.g. `1` -> `"active"`).
+
+        :param field: The name of the state variable.
+        :param value: An internal value of the state variable.
+        :return: The URL query param representation of `value`.
+        """
+
+        # Gets the metadata for the field - raises an error if not found
+        metadata = cls._model_metadata.get(field)
+        if not metadata:
+            raise ValueError(f"Field '{field}' is not defined in the PageState.")
+
+        return convert_to_URL(field, value, metadata.get("value_map"))
 
     @classmethod
-    def dump(cls):
-        """Returns a dict copy of the current session state values."""
+    def dump(cls, copy: bool = True):
+        """Returns a dict copy of the current session state values.
+
+        With `copy=False` the live namespace is returned instead, for read-only callers; it must not be mutated.
+        """
 
-        # If there is session state for this class, return a copy of it
+        # If there is session state for this class, return it (copied unless asked otherwise)
         if SESSION_STATE_KEY in st.session_state:
-            return dict(st.session_state[SESSION_STATE_KEY].get(cls.__name__, {}))
+            class_ns = st.session_state[SESSION_STATE_KEY].get(cls.__name__, {})
+            return dict(class_ns) if copy else class_ns
         
         # Otherwise, return an empty dict
         return {}
 
     @classmethod
     def reset(cls, field: str = None):
-        """Resets all fields to their default values."""
+        """Resets all fields (or only the given one) to their default values."""
 
-        for state_field, metadata in cls._model_metadata.items():
-            
-            # Logic to reset only a specific field or all of them
-            if not field or field == state_field:
+        # Resetting every field goes through a single batched update
+        if not field:
+            cls._reset_all()
+            return
+
+        metadata = cls._model_metadata.get(field)
+        if metadata:
 
-                # Gets the default value
-                default = metadata['default']
+            # Sets a copy of the default using setattr (triggers __setattr__ in the metaclass, which updates session state and URL)
+            setattr(cls, field, cls._fresh_default(field))
 
-                # Sets it using setattr (triggers __setattr__ in the metaclass, which updates session state and URL)
-                setattr(cls, state_field, default)
+    @classmethod
+    def hydrate_all(cls, *classes):
+        """
+        Initializes the state of several PageState classes in a single pass.
+
+        Reads `st.query_params` once, routes each query param to the fields that use it
+        and seeds every remaining field with its default. Afterwards, reading any of the
+        fields is a plain session state lookup.
+
+        Already initialized fields are left untouched, and the URL is not written here:
+        it is restored on the next access when `restore_url_on_touch` is enabled.
+
+        :param classes: (Optional) The PageState classes to initialize. Defaults to every registered class.
+        """
+
+        # Resolves the target classes by name, defaulting to every registered class
+        targets = {state_cls.__name__: state_cls for state_cls in (classes or _PAGE_STATE_REGISTRY.values())}
+
+        # Ensuring the class namespaces on session state are defined
+        for state_cls in targets.values():
+            state_cls._namespace()
+
+        namespaces = st.session_state[SESSION_STATE_KEY]
+
+        # Classes that got at least one field seeded by this call
+        seeded = set()
+
+        # ---
+        # 1. Route every query param to the fields that read it
+        for url_key, url_value in st.query_params.items():
+            for class_name, field in _URL_KEY_REGISTRY.get(url_key, {}).items():
+
+                # Skip classes not being hydrated and stale registrations of redefined classes
+                # (a field removed, or now read from another `url_key`/`url_prefix`)
+                state_cls = targets.get(class_name)
+                if state_cls is None or state_cls._field_url_keys.get(field) != url_key:
+                    continue
+
+                # Skip fields that are already initialized
+                class_ns = namespaces[class_name]
+                if field in class_ns:
+                    continue
+
+                value = state_cls._value_from_url(field, url_value)
+                if value is not None:
+                    class_ns[field] = value
+                    seeded.add(class_name)
+
+        # ---
+        # 2. Seed every remaining field with a copy of its default
+        for class_name, state_cls in targets.items():
+            class_ns = namespaces[class_name]
+
+            for field in state_cls._model_metadata:
+                if field not in class_ns:
+                    class_ns[field] = state_cls._fresh_default(field)
+                    seeded.add(class_name)
+
+            # Already initialized classes keep their version, so they are not saved again
+            if class_name in seeded:
+                state_cls._bump_version()
 
     @classmethod
     def bind(cls, field: str, value: Any = None):
@@ -58,13 +168,19 @@ class PageState(metaclass=PageStateMeta):
         :return: A dictionary with 'key' and 'on_change' to be unpacked into the widget.
         """
 
-        # Gets the metadata for the field - raises an error if not found
-        metadata = cls._model_metadata.get(field)
-        if not metadata:
-            raise ValueError(f"Field '{field}' is not defined in the PageState.")
+        # Reuses the widget key and callback built on the first bind of this field
+        cached = cls._bind_cache.get(field)
+        if cached is None:
+
+            # Gets the precomputed widget key for the field - raises an error if not found
+            widget_key = cls._widget_keys.get(field)
+            if widget_key is None:
+                raise ValueError(f"Field '{field}' is not defined in the PageState.")
+
+            # Builds the callback that updates the state variable when the widget changes
+            cached = cls._bind_cache[field] = (widget_key, _BindCallback(cls, field, widget_key))
 
-        # Creates a unique key for the widget
-        widget_key = f"{cls.__name__}_{field}_widget"
+        widget_key, callback = cached
 
         # Sets the initial value for the widget in session state
         # Only if not already set, to avoid overwriting user interactions on re-renders
@@ -79,15 +195,6 @@ class PageState(metaclass=PageStateMeta):
             
             st.session_state[widget_key] = initial_value
 
-        # Defines the callback function to update the state variable
-        def callback():
-
-            # Gets the new value from session state
-            new_value = st.session_state.get(widget_key)
-
-            # Updates the state variable using setattr (triggers __setattr__ in the metaclass, which updates session state and URL)
-            setattr(cls, field, new_value)
-
         # Returns the binding information
         return {
             'key': widget_key,
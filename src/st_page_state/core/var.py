@@ -21,6 +21,9 @@ class StateVar:
             )
     """
 
+    # StateVar only ever holds these attributes, so it does not need a per-instance __dict__
+    __slots__ = ("default", "url_key", "value_map", "_reverse_value_map")
+
     def __init__(
         self,
         default: Any,
@@ -42,4 +45,12 @@ class StateVar:
         # Store parameters
         self.default = default
         self.url_key = url_key
-        self.value_map = value_map
\ No newline at end of file
+        self.value_map = value_map
+
+        # Reversed value map (URL value -> internal value), built once here instead of on every URL read.
+        # Left unset for maps with unhashable URL values, which the converter then reports when reading.
+        try:
+            self._reverse_value_map = {v: k for k, v in value_map.items()} if value_map else None
+
+        except TypeError:
+            self._reverse_value_map = None
@@ -9,4 +9,13 @@ class InvalidQueryParamError(StPageStateError):
     """Raised when a query param cannot be converted to the target type."""
 
     def __init__(self, key: str, value: str, target_type: Any, original_error: Exception):
-        super().__init__(f"Failed to parse query param '{key}={value}' as {target_type}: {original_error}")
\ No newline at end of file
+
+        # The message is only formatted when read (see `__str__`): failed conversions are often caught and discarded
+        super().__init__(key, value, target_type, original_error)
+        self.key = key
+        self.value = value
+        self.target_type = target_type
+        self.original_error = original_error
+
+    def __str__(self) -> str:
+        return f"Failed to parse query param '{self.key}={self.value}' as {self.target_type}: {self.original_error}"
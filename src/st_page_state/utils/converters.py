@@ -1,14 +1,40 @@
 import datetime
+import enum
 import json
 import logging
 import base64
-from typing import Any, Dict, Type, get_origin, get_args
-from collections.abc import Hashable
+import binascii
+import math
+import re
+import uuid
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, Tuple, Type, get_origin, get_args
 
 from ..errors import InvalidQueryParamError
 
 logger = logging.getLogger(__name__)
 
+# ---
+# JSON codecs of the Base64 list format in URLs and of the serialized state.
+# Uses orjson when installed (``pip install st-page-state[orjson]``), the stdlib otherwise.
+# Both produce the same compact URL output, so URLs do not depend on which one is installed.
+try:
+    import orjson
+
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _url_json_dumps = orjson.dumps
+    _url_json_loads = orjson.loads
+
+else:
+
+    def _url_json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    _url_json_loads = json.loads
+
 # ---------------------------------------------------------------------------
 # State serialization (used by the Redis backend)
 # ---------------------------------------------------------------------------
@@ -42,6 +68,37 @@ def _prepare_for_json(obj: Any) -> Any:
     return None
 
 
+# Exact types the stdlib encoder writes as they are (subclasses, e.g. enums, take the full walk)
+_JSON_NATIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _is_all_native(obj: Any) -> bool:
+    """
+    Whether ``obj`` is made of JSON-native values only, so ``_prepare_for_json`` would return an equal copy of it.
+    """
+
+    obj_type = type(obj)
+    if obj_type in _JSON_NATIVE_TYPES:
+        return True
+    if obj_type is dict:
+        return all(_is_all_native(v) for v in obj.values())
+    if obj_type is list:
+        return all(_is_all_native(v) for v in obj)
+
+    return False
+
+
+# Constructor of each type-tagged envelope, by its "__type__"
+_STATE_REVIVERS = {
+    "datetime": datetime.datetime.fromisoformat,
+    "date": datetime.date.fromisoformat,
+    "time": datetime.time.fromisoformat,
+    "set": set,
+    "tuple": tuple,
+    "bytes": base64.b64decode,
+}
+
+
 def _state_json_hook(dct: dict) -> Any:
     """``json.loads`` object hook — reconstruct typed objects from their envelope."""
 
@@ -49,37 +106,304 @@ def _state_json_hook(dct: dict) -> Any:
     if t is None:
         return dct
     
-    v = dct["__value__"]
-    
-    if t == "datetime":
-        return datetime.datetime.fromisoformat(v)
-    if t == "date":
-        return datetime.date.fromisoformat(v)
-    if t == "time":
-        return datetime.time.fromisoformat(v)
-    if t == "set":
-        return set(v)
-    if t == "tuple":
-        return tuple(v)
-    if t == "bytes":
-        return base64.b64decode(v)
-    
-    return dct
+    reviver = _STATE_REVIVERS.get(t)
+    if reviver is None:
+        return dct
+
+    return reviver(dct["__value__"])
+
+
+class _NeedsStdlibJSON(ValueError):
+    """A state value orjson would write lossily (NaN and infinities become null); the stdlib codec handles it."""
+
+
+def _wrap_tuples(obj: Any) -> Any:
+    """
+    Replace tuples with their type-tagged envelope (orjson writes tuples as plain arrays, without calling ``default``).
+    Containers holding no tuple are returned as they are, so the common case allocates nothing.
+    Raises ``_NeedsStdlibJSON`` on non-finite floats, which orjson would silently write as null.
+    Also hands orjson-native values the stdlib codec cannot write to ``_encode_special``, so both codecs agree.
+    """
+
+    if isinstance(obj, tuple):
+        return {"__type__": "tuple", "__value__": [_wrap_tuples(i) for i in obj]}
+
+    if isinstance(obj, dict):
+        wrapped = None
+        for k, v in obj.items():
+            w = _wrap_tuples(v)
+            if w is not v:
+                if wrapped is None:
+                    wrapped = dict(obj)
+                wrapped[k] = w
+
+        return obj if wrapped is None else wrapped
+
+    if isinstance(obj, list):
+        wrapped = None
+        for i, v in enumerate(obj):
+            w = _wrap_tuples(v)
+            if w is not v:
+                if wrapped is None:
+                    wrapped = list(obj)
+                wrapped[i] = w
+
+        return obj if wrapped is None else wrapped
+
+    if isinstance(obj, float) and not math.isfinite(obj):
+        raise _NeedsStdlibJSON(obj)
+
+    # orjson writes enums as their value and UUIDs as strings; the stdlib codec only writes enums that are
+    # also str/int/float (by value) and replaces anything else with None, so these take the same route
+    if isinstance(obj, (enum.Enum, uuid.UUID)) and not isinstance(obj, (str, int, float)):
+        return _encode_special(obj)
+
+    return obj
+
+
+def _encode_special(obj: Any) -> Any:
+    """orjson ``default`` hook — type-tagged envelope of the values orjson does not write natively (or must not)."""
+
+    if isinstance(obj, (set, frozenset)):
+        return {"__type__": "set", "__value__": [_wrap_tuples(i) for i in obj]}
+    if isinstance(obj, datetime.datetime):
+        return {"__type__": "datetime", "__value__": obj.isoformat()}
+    if isinstance(obj, datetime.date):
+        return {"__type__": "date", "__value__": obj.isoformat()}
+    if isinstance(obj, datetime.time):
+        return {"__type__": "time", "__value__": obj.isoformat()}
+    if isinstance(obj, bytes):
+        return {"__type__": "bytes", "__value__": base64.b64encode(obj).decode()}
+
+    # orjson only writes exact floats natively; the stdlib codec writes subclasses too
+    if isinstance(obj, float):
+        return float(obj)
+
+    logger.warning(f"skipping non-serializable value of type {type(obj).__name__} (replaced with None)")
+    return None
+
+
+def _revive_state(obj: Any) -> Any:
+    """
+    Apply ``_state_json_hook`` bottom-up, as ``json.loads(object_hook=...)`` does (orjson has no hook).
+    Works in place on the freshly decoded tree, descending only into containers.
+    """
+
+    if type(obj) is dict:
+        for k, v in obj.items():
+            if type(v) in (dict, list):
+                obj[k] = _revive_state(v)
+
+        return _state_json_hook(obj) if "__type__" in obj else obj
+
+    if type(obj) is list:
+        for i, v in enumerate(obj):
+            if type(v) in (dict, list):
+                obj[i] = _revive_state(v)
+
+    return obj
+
+
+if orjson is not None:
+
+    # Envelopes for datetimes (instead of orjson's plain ISO strings) and None for dataclasses, as with the stdlib
+    # codec; enums, UUIDs and float subclasses are aligned by `_wrap_tuples` and `_encode_special`
+    _STATE_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+# Digit runs orjson may not read back exactly: it parses integers past the 64-bit range as floats.
+# Matches inside strings too, which only sends those payloads through the (equally correct) stdlib decoder.
+_LONG_DIGITS = re.compile(r"\d{19,}")
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19,}")
+
+
+def _stdlib_serialize_state(data: Dict[str, Any], ensure_ascii: bool = False) -> str:
+    """
+    Serialize a state dict with the stdlib encoder (the codec without orjson, and orjson's fallback).
+    Compact and unescaped like orjson's output, so a state is stored as the same bytes whichever codec is installed
+    (float exponents aside: ``1e+20`` here, ``1e20`` from orjson).
+    """
+
+    # Plain states need no tagged copy
+    if not _is_all_native(data):
+        data = _prepare_for_json(data)
+
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=ensure_ascii)
 
 
 def serialize_state(data: Dict[str, Any]) -> str:
     """Serialize a state dict to a JSON string for external storage."""
-    return json.dumps(_prepare_for_json(data))
+
+    if orjson is not None:
+        return serialize_state_bytes(data).decode()
+
+    return _stdlib_serialize_state(data)
+
+
+def serialize_state_bytes(data: Dict[str, Any]) -> bytes:
+    """
+    Serialize a state dict to UTF-8 JSON bytes, the form storage clients send (orjson produces it directly).
+    States orjson cannot write exactly (integers past 64 bits, NaN and infinities) take the stdlib codec.
+    """
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(_wrap_tuples(data), default=_encode_special, option=_STATE_ORJSON_OPTIONS)
+
+        except (orjson.JSONEncodeError, _NeedsStdlibJSON):
+            pass
+
+    try:
+        return _stdlib_serialize_state(data).encode()
+
+    # Lone surrogates have no UTF-8 form; their escaped (ASCII) spelling does
+    except UnicodeEncodeError:
+        return _stdlib_serialize_state(data, ensure_ascii=True).encode()
 
 
 def deserialize_state(raw: str) -> Dict[str, Any]:
-    """Deserialize a JSON string back into a state dict."""
+    """
+    Deserialize a JSON string (or bytes) back into a state dict.
+    Payloads orjson cannot read exactly (big integers, or the NaN/Infinity literals of the stdlib codec) take the stdlib one.
+    """
+
+    if orjson is not None:
+        long_digits = _LONG_DIGITS_BYTES if isinstance(raw, (bytes, bytearray)) else _LONG_DIGITS
+        if long_digits.search(raw) is None:
+            try:
+                return _revive_state(orjson.loads(raw))
+
+            except orjson.JSONDecodeError:
+                pass
+
     return json.loads(raw, object_hook=_state_json_hook)
 
 SEPARATOR = "||"
 
-def convert_from_URL(key: str, value: str, target_type: Type, value_map: dict = None) -> Any:
-    """Converts URL string to Python object with error handling."""
+# Sentinel of value_map lookups (None is a valid mapped value)
+_MISSING = object()
+
+# Bound of the scalar conversion caches (one entry per distinct (value, type) pair seen)
+_CONVERSION_CACHE_SIZE = 512
+
+# Immutable scalar types whose conversions are cached (an arbitrary hashable object may still be mutable).
+# float, datetime and time are left out: equal values of them can format differently (-0.0 == 0.0, and
+# aware datetimes/times equal across UTC offsets), and the cache would hand back the first one's string.
+_CACHEABLE_SCALAR_TYPES = frozenset({str, int, bool, datetime.date})
+
+# URL-safe Base64 alphabet <-> standard alphabet, translated in a single C call
+_B64_TO_URLSAFE = bytes.maketrans(b"+/", b"-_")
+_B64_FROM_URLSAFE = str.maketrans("-_", "+/")
+
+def _b64url_encode(payload: bytes) -> str:
+    """URL-safe Base64 of `payload`, without the "=" padding (`base64.urlsafe_b64encode` minus its wrappers)."""
+    return binascii.b2a_base64(payload, newline=False).translate(_B64_TO_URLSAFE).rstrip(b"=").decode("ascii")
+
+def _b64url_decode(value: str) -> bytes:
+    """Decodes URL-safe Base64 with or without the "=" padding (raises `ValueError` on non-ASCII input)."""
+    return binascii.a2b_base64(value.translate(_B64_FROM_URLSAFE) + "=" * (-len(value) % 4))
+
+def _is_hashable(value: Any) -> bool:
+    """Same answer as `isinstance(value, Hashable)`, read straight off the type (no ABC dispatch)."""
+    return type(value).__hash__ is not None
+
+# URL strings read as True for bool fields (anything else is False)
+_TRUTHY = frozenset(('true', '1', 't', 'yes', 'on'))
+
+def _to_bool(value: str) -> bool:
+
+    # Already-lowercase inputs ("true", "1", ...) skip the `lower()` copy
+    if value in _TRUTHY:
+        return True
+
+    return value.lower() in _TRUTHY
+
+# Parser of each simple type, dispatched with a single dict lookup
+_SCALAR_PARSERS = {
+    bool: _to_bool,
+    int: int,
+    float: float,
+    datetime.date: datetime.date.fromisoformat,
+    datetime.datetime: datetime.datetime.fromisoformat,
+    datetime.time: datetime.time.fromisoformat,
+}
+
+def _resolve_origin_args(target_type: Type) -> Tuple[Any, Tuple]:
+    return get_origin(target_type), get_args(target_type)
+
+_cached_origin_args = lru_cache(maxsize=_CONVERSION_CACHE_SIZE)(_resolve_origin_args)
+
+def _origin_args(target_type: Type) -> Tuple[Any, Tuple]:
+    """
+    Cached `(get_origin, get_args)` of a type: typing introspection is slow and a field's annotation never changes.
+    """
+
+    try:
+        return _cached_origin_args(target_type)
+
+    # Unhashable annotation (e.g. `Annotated` with unhashable metadata)
+    except TypeError:
+        return _resolve_origin_args(target_type)
+
+@lru_cache(maxsize=_CONVERSION_CACHE_SIZE, typed=True)
+def _parse_scalar(value: Any, target_type: Type) -> Any:
+    """
+    Converts a (mapped) URL value to a scalar of the target type.
+    Cached: the same query params are parsed again on every rerun, and scalar results are immutable.
+    """
+
+    parser = _SCALAR_PARSERS.get(target_type)
+    if parser is None:
+        return value # Fallback to string
+
+    return parser(value)
+
+# URL formatter of each simple type (by exact type; subclasses take the isinstance checks below)
+_SCALAR_FORMATTERS = {
+    str: str,
+    int: str,
+    float: str,
+    bool: lambda value: "true" if value else "false",
+    datetime.date: datetime.date.isoformat,
+    datetime.datetime: datetime.datetime.isoformat,
+    datetime.time: datetime.time.isoformat,
+}
+
+@lru_cache(maxsize=_CONVERSION_CACHE_SIZE, typed=True)
+def _format_scalar(value: Any) -> str:
+    """
+    Converts a scalar to its URL string.
+    Cached per (type, value), so True and 1 never share an entry; only call it for `_CACHEABLE_SCALAR_TYPES`.
+    """
+
+    formatter = _SCALAR_FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+
+    if isinstance(value, (datetime.date, datetime.datetime, datetime.time)):
+        return value.isoformat()
+
+    return str(value)
+
+def _parse_scalar_items(key: str, items: Iterable, item_type: Type) -> Iterator:
+    """
+    Parses the items of an iterable URL value into a scalar item type, without re-entering `convert_from_URL` per item.
+    """
+
+    for i, item in enumerate(items):
+        try:
+            if type(item) is str:
+                yield _parse_scalar(item, item_type)
+            else:
+                yield _parse_scalar.__wrapped__(item, item_type)
+
+        except Exception as e:
+            raise InvalidQueryParamError(f"{key}[{i}]", item, item_type, e)
+
+def convert_from_URL(key: str, value: str, target_type: Type, value_map: dict = None, reverse_map: dict = None) -> Any:
+    """
+    Converts URL string to Python object with error handling.
+    `reverse_map` is the precomputed reverse of `value_map`; when omitted it is built from `value_map`.
+    """
 
     try:
 
@@ -87,69 +411,64 @@ def convert_from_URL(key: str, value: str, target_type: Type, value_map: dict =
         # Value mapping handling.
         # Value map is a way to convert strings to other values before type conversion.
         # e.g.: value_map = {"active": 1, "inactive": 0} will convert "active" to 1 before type conversion.
-        if value_map is not None and isinstance(value, Hashable):
-
-            # Reversing the map, so we can map from URL value to internal value
-            reverse_map = {v: k for k, v in value_map.items()}
+        if value_map is not None and _is_hashable(value):
 
-            if value in reverse_map:
+            # Reversing the map, so we can map from URL value to internal value (unless the caller did it already)
+            if reverse_map is None:
+                reverse_map = {v: k for k, v in value_map.items()}
 
-                # Convert it
-                value = reverse_map[value]
+            # Convert it (one lookup; mapped values may legitimately be None)
+            mapped = reverse_map.get(value, _MISSING)
+            if mapped is not _MISSING:
+                value = mapped
 
         # ---
         # Type conversion
+        # If the type is "list[str]" the origin is "list" and the args are "(str,)"
+        origin, type_args = _origin_args(target_type)
+
+        # Simple types (cached; iterable results are mutable, so they are rebuilt on every call)
+        if origin not in (list, tuple, set):
+            if type(value) is str:
+                return _parse_scalar(value, target_type)
+
+            return _parse_scalar.__wrapped__(value, target_type)
 
-        # Simple types
-        if target_type == bool:
-            return value.lower() in ('true', '1', 't', 'yes', 'on')
-        if target_type == int:
-            return int(value)
-        if target_type == float:
-            return float(value)
-        if target_type == datetime.date:
-            return datetime.date.fromisoformat(value)
-        if target_type == datetime.datetime:
-            return datetime.datetime.fromisoformat(value)
-        if target_type == datetime.time:
-            return datetime.time.fromisoformat(value)
-        
         # ---
         # Iterable types handling
-        origin = get_origin(target_type) # If the type is "list[str]" returns "list"
-
         if origin in (list, tuple, set):
 
-            # Try to decode from Base64 JSON
+            # Try to decode from Base64 JSON (the "=" padding is stripped when encoding, so restore it)
             try:
-                decoded_json = base64.urlsafe_b64decode(value).decode()
-                items_str = json.loads(decoded_json)
+                items_str = _url_json_loads(_b64url_decode(value))
+
+                if not isinstance(items_str, list):
+                    raise ValueError("Base64 JSON value is not a list")
             
-            # Fallback to separator format
+            # Fallback to separator format (empty items dropped by a C-level filter)
             except Exception:
-                items_str = [v for v in value.split(SEPARATOR) if v]
+                items_str = filter(None, value.split(SEPARATOR))
 
             # Default item type
             item_type = str
 
-            # Gets the internal args of a type. If the type is "list[str]" returns "str"
-            type_args = get_args(target_type)
-
             # If there are args, gets the first
             if type_args:
                 item_type = type_args[0]
             
-            # Recursive call for items
-            items_converted = [convert_from_URL(f"{key}[{i}]", item, item_type) for i, item in enumerate(items_str)]
+            # Items are consumed directly by the target container (single pass, no intermediate list).
+            # Scalar items are parsed in place; nested iterables need the recursive call.
+            if _origin_args(item_type)[0] in (list, tuple, set):
+                items_converted = (convert_from_URL(f"{key}[{i}]", item, item_type) for i, item in enumerate(items_str))
+            else:
+                items_converted = _parse_scalar_items(key, items_str, item_type)
             
-            # Try to cast the list to the original iterable type
-            if origin == tuple: return tuple(items_converted)
-            if origin == set: return set(items_converted)
+            # Build the original iterable type
+            if origin is tuple: return tuple(items_converted)
+            if origin is set: return set(items_converted)
 
             # Fallback to list
-            return items_converted
-
-        return value # Fallback to string
+            return list(items_converted)
     
     except Exception as e:
 
@@ -157,49 +476,83 @@ def convert_from_URL(key: str, value: str, target_type: Type, value_map: dict =
         raise InvalidQueryParamError(key, value, target_type, e)
     
 
+def make_URL_decoder(key: str, target_type: Type, value_map: dict = None, reverse_map: dict = None) -> Callable[[str], Any]:
+    """
+    Builds the URL value converter of one field, equivalent to `convert_from_URL` with these arguments.
+    For scalar types the type dispatch is resolved once here; iterable types (and value maps with
+    unhashable URL values) use `convert_from_URL` itself.
+    """
+
+    if value_map is not None and reverse_map is None:
+        try:
+            reverse_map = {v: k for k, v in value_map.items()}
+        except TypeError:
+            return lambda value: convert_from_URL(key, value, target_type, value_map)
+
+    if _origin_args(target_type)[0] in (list, tuple, set):
+        return lambda value: convert_from_URL(key, value, target_type, value_map, reverse_map)
+
+    def decode(value: str) -> Any:
+        try:
+
+            # Value mapping (same rules as `convert_from_URL`)
+            if reverse_map is not None and _is_hashable(value):
+                mapped = reverse_map.get(value, _MISSING)
+                if mapped is not _MISSING:
+                    value = mapped
+
+            if type(value) is str:
+                return _parse_scalar(value, target_type)
+
+            return _parse_scalar.__wrapped__(value, target_type)
+
+        except Exception as e:
+            raise InvalidQueryParamError(key, value, target_type, e)
+
+    return decode
+
 def convert_to_URL(key: str, value: Any, value_map: dict = None) -> str:
     """Converts Python object to URL string with error handling."""
 
     try:
 
         # ---
-        # Type conversion
-        
-        # Default conversion to string
-        converted_value = str(value)
-
-        if isinstance(value, bool):
-            converted_value = "true" if value else "false"
-        if isinstance(value, (int, float)):
-            converted_value = str(value)
-        if isinstance(value, (datetime.date, datetime.datetime, datetime.time)):
-            converted_value = value.isoformat()
+        # Value mapping handling (first: a mapped value needs no conversion at all).
+        # Value map is a way to convert values to other values.
+        # e.g.: value_map = {1: "active", 0: "inactive"} will convert 1 to "active".
+        if value_map is not None and _is_hashable(value):
+            mapped = value_map.get(value, _MISSING)
+            if mapped is not _MISSING:
+                return mapped
 
         # ---
         # Iterable types handling
         if isinstance(value, (list, tuple, set)):
 
-            # Recursive call for items
-            items_str = [convert_to_URL(f"{key}[{i}]", item, value_map) for i, item in enumerate(value)]
+            # Fast path: plain integer iterables are written as "1||2||3".
+            # The result is never valid Base64-encoded JSON, so convert_from_URL falls back to the separator format.
+            if value and value_map is None and all(type(item) is int for item in value):
+                return SEPARATOR.join(map(str, value))
 
-            # Serialize to JSON and then to Base64
-            json_str = json.dumps(items_str)
-            converted_value = base64.urlsafe_b64encode(json_str.encode()).decode()
+            # Unmapped scalar items are formatted in place; anything else needs the recursive call
+            if value_map is None and all(type(item) in _SCALAR_FORMATTERS for item in value):
+                items_str = [
+                    _format_scalar(item) if type(item) in _CACHEABLE_SCALAR_TYPES else _format_scalar.__wrapped__(item)
+                    for item in value
+                ]
 
-        # ---
-        # Value mapping handling.
-        # Value map is a way to convert values to other values.
-        # e.g.: value_map = {1: "active", 0: "inactive"} will convert 1 to "active".
-        if value_map is not None and isinstance(value, Hashable):
-            if value in value_map:
-                converted_value = value_map[value]
+            else:
+                items_str = [convert_to_URL(f"{key}[{i}]", item, value_map) for i, item in enumerate(value)]
+
+            # Serialize to JSON and then to Base64, without the "=" padding
+            return _b64url_encode(_url_json_dumps(items_str))
 
         # ---
-        # Important note: At this time, the converted value is the string representation of the value, or the mapped value.
-        # ---
+        # Type conversion (cached for immutable scalars)
+        if type(value) in _CACHEABLE_SCALAR_TYPES:
+            return _format_scalar(value)
 
-        # Return the converted and/or mapped value
-        return converted_value
+        return _format_scalar.__wrapped__(value)
     
     except Exception as e:
 
@@ -9,11 +9,76 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../src'
 
 # Mock streamlit before importing anything else from st_page_state
 # This is necessary because st_page_state imports streamlit at the top level
+class MockQueryParams(dict):
+    """
+    Plain dict standing in for `st.query_params`, with its bulk `from_dict` setter and `get_all`.
+    As in Streamlit, a repeated param (`?tag=a&tag=b`) reads as its last value; `get_all` returns every one.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._repeated = {}
+
+    def __setitem__(self, key, value):
+        self._repeated.pop(key, None)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._repeated.pop(key, None)
+        super().__delitem__(key)
+
+    def clear(self):
+        self._repeated.clear()
+        super().clear()
+
+    def from_dict(self, params):
+        self.clear()
+        for key, value in params.items():
+            values = [value] if isinstance(value, str) else list(value)
+            super().__setitem__(key, values[-1])
+            if len(values) > 1:
+                self._repeated[key] = values
+
+    def get_all(self, key):
+        if key in self._repeated:
+            return list(self._repeated[key])
+
+        return [self[key]] if key in self else []
+
 mock_st = MagicMock()
 mock_st.session_state = {}
-mock_st.query_params = {}
+mock_st.query_params = MockQueryParams()
 sys.modules["streamlit"] = mock_st
 
+@pytest.fixture()
+def query_param_writes(monkeypatch):
+    """
+    Records every write pushed to the mocked `st.query_params` from here on,
+    as `("set", key)`, `("del", key)` or `("from_dict", params)`.
+    """
+    writes = []
+
+    original_setitem = MockQueryParams.__setitem__
+    original_delitem = MockQueryParams.__delitem__
+    original_from_dict = MockQueryParams.from_dict
+
+    def setitem(self, key, value):
+        writes.append(("set", key))
+        original_setitem(self, key, value)
+
+    def delitem(self, key):
+        writes.append(("del", key))
+        original_delitem(self, key)
+
+    def from_dict(self, params):
+        writes.append(("from_dict", dict(params)))
+        original_from_dict(self, params)
+
+    monkeypatch.setattr(MockQueryParams, "__setitem__", setitem)
+    monkeypatch.setattr(MockQueryParams, "__delitem__", delitem)
+    monkeypatch.setattr(MockQueryParams, "from_dict", from_dict)
+    return writes
+
 @pytest.fixture(autouse=True)
 def reset_mock_state():
     """
@@ -238,3 +238,172 @@ class TestConfig:
         assert st.query_params["a"] == "initial_a"
         assert "b" in st.query_params
         assert st.query_params["b"] == "initial_b"
+
+    def test_session_only_class_leaves_url_untouched(self):
+        """Test that a class without URL-synced fields never reads or writes query params."""
+
+        class SessionOnlyPage(PageState):
+            note: str = StateVar(default="")
+
+        st.query_params["other"] = "kept"
+
+        SessionOnlyPage.note = "hello"
+        _ = SessionOnlyPage.note
+
+        assert st.query_params == {"other": "kept"}
+
+    def test_selfish_write_commits_url_once(self, query_param_writes):
+        """Test that a selfish write with restore-on-touch pushes a single URL update."""
+
+        class BatchedPage(PageState):
+            class Config:
+                url_prefix = "bp_"
+
+            a: str = StateVar(default="a0", url_key="a")
+            b: str = StateVar(default="b0", url_key="b")
+
+        st.query_params["foreign"] = "x"
+        st.query_params["other"] = "y"
+        query_param_writes.clear()
+
+        # Removes two foreign keys, writes "a" and restores "b": one commit
+        BatchedPage.a = "a1"
+
+        assert query_param_writes == [("from_dict", {"bp_a": "a1", "bp_b": "b0"})]
+        assert st.query_params == {"bp_a": "a1", "bp_b": "b0"}
+
+        # Nothing changes on the URL: no write at all
+        query_param_writes.clear()
+        BatchedPage.a = "a1"
+        assert query_param_writes == []
+
+    def test_url_commit_keeps_params_it_did_not_change(self, query_param_writes):
+        """Test that committing staged URL changes leaves other keys alone, repeated params included."""
+
+        class TaggedPage(PageState):
+            class Config:
+                url_selfish = False
+
+            a: str = StateVar(default="a0", url_key="a")
+            b: str = StateVar(default="b0", url_key="b")
+
+        st.query_params.from_dict({"tag": ["x", "y"], "a": "a0", "b": "b0"})
+        query_param_writes.clear()
+
+        # A single changed key is written in place
+        TaggedPage.a = "a1"
+        assert query_param_writes == [("set", "a")]
+
+        # Several changed keys ("a" restored, "b" written) take one bulk commit
+        del st.query_params["a"]
+        TaggedPage.b = "b1"
+
+        assert st.query_params == {"tag": "y", "a": "a1", "b": "b1"}
+        assert st.query_params.get_all("tag") == ["x", "y"]
+
+    def test_share_url_with_class_defined_later(self):
+        """Test that a shared class named by string is picked up once it is defined."""
+
+        class EarlySharer(PageState):
+            class Config:
+                share_url_with = ["LateShared"]
+
+            e: str = StateVar(default="e0", url_key="e")
+
+        st.query_params["l"] = "stale"
+        EarlySharer.e = "e1"
+        assert "l" not in st.query_params  # LateShared does not exist yet
+
+        class LateShared(PageState):
+            class Config:
+                url_selfish = False
+
+            l: str = StateVar(default="l0", url_key="l")
+
+        LateShared.l = "l1"
+        EarlySharer.e = "e2"
+        assert st.query_params == {"e": "e2", "l": "l1"}
+        assert EarlySharer._allowed_url_keys == frozenset({"e", "l"})
+
+    def test_focus_before_any_access_restores_defaults(self):
+        """Test that focus() on a class never accessed yet restores its URL params from the defaults."""
+
+        class UntouchedFocus(PageState):
+            u: str = StateVar(default="u0", url_key="u")
+
+        st.query_params["foreign"] = "x"
+        UntouchedFocus.focus()
+
+        assert st.query_params == {"u": "u0"}
+
+    def test_read_with_complete_url_does_not_stage(self, monkeypatch):
+        """Test that reads skip the URL machinery when every param of the class is already present."""
+        from st_page_state.core import meta
+
+        class CompleteUrl(PageState):
+            a: str = StateVar(default="a0", url_key="a")
+            b: str = StateVar(default="b0", url_key="b")
+
+        _ = CompleteUrl.a
+        _ = CompleteUrl.b
+        assert st.query_params == {"a": "a0", "b": "b0"}
+
+        staged = []
+        original = meta._staged_query_params
+        monkeypatch.setattr(meta, "_staged_query_params", lambda: (staged.append(1), original())[1])
+
+        for _ in range(3):
+            _ = CompleteUrl.a
+
+        assert staged == []
+
+        # A param removed by hand is restored on the next read
+        del st.query_params["b"]
+        _ = CompleteUrl.a
+        assert st.query_params == {"a": "a0", "b": "b0"}
+
+    def test_deep_link_seeds_every_field_on_first_touch(self):
+        """Test that touching one field of a class seeds its other fields from the URL before a selfish class strips them."""
+
+        class DeepA(PageState):
+            class Config:
+                url_selfish = False
+
+            a1: str = StateVar(default="d1", url_key="a1")
+            a2: str = StateVar(default="d2", url_key="a2")
+
+        class DeepB(PageState):
+            b: str = StateVar(default="d3", url_key="b")
+
+        st.query_params.from_dict({"a1": "x", "a2": "y", "b": "z"})
+
+        assert DeepA.a1 == "x"
+        assert DeepB.b == "z"
+        assert DeepA.a2 == "y"
+
+    def test_read_with_ignored_none_param_does_not_stage(self, monkeypatch):
+        """Test that a param left out of the URL for a None value (ignore_none_url) does not defeat the read fast path."""
+        from st_page_state.core import meta
+
+        class OptionalUrl(PageState):
+            a: str = StateVar(default="a0", url_key="a")
+            q: str = StateVar(default=None, url_key="q")
+
+        _ = OptionalUrl.a
+        _ = OptionalUrl.q
+        assert st.query_params == {"a": "a0"}
+
+        staged = []
+        original = meta._staged_query_params
+        monkeypatch.setattr(meta, "_staged_query_params", lambda: (staged.append(1), original())[1])
+
+        for _ in range(3):
+            _ = OptionalUrl.a
+
+        assert staged == []
+
+        # A value set again is still restored once removed by hand
+        OptionalUrl.q = "x"
+        del st.query_params["q"]
+        _ = OptionalUrl.a
+        assert st.query_params == {"a": "a0", "q": "x"}
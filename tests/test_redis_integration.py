@@ -1,5 +1,14 @@
 import sys
+import json
+import math
 import datetime
+import enum
+import uuid
+import fnmatch
+import re
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
 import pytest
 from unittest.mock import MagicMock
 
@@ -7,6 +16,37 @@ from unittest.mock import MagicMock
 # Fake redis module — registered before any import touches it
 # ---------------------------------------------------------------------------
 
+class _FakePipeline:
+    """Queues commands and replays them on the client at ``execute()``."""
+    def __init__(self, client):
+        self._client = client
+        self._commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._commands.append((name, args, kwargs))
+            return self
+        return queue
+
+    def execute(self, raise_on_error=True):
+        commands, self._commands = self._commands, []
+        results = []
+        for name, args, kwargs in commands:
+            try:
+                results.append(getattr(self._client, name)(*args, **kwargs))
+            except Exception as exc:
+                if raise_on_error:
+                    raise
+                results.append(exc)
+        return results
+
+
+@lru_cache(maxsize=256)
+def _compile_glob(pattern):
+    """Compiled matcher of a SCAN ``MATCH`` glob, built once per pattern."""
+    return re.compile(fnmatch.translate(pattern)).match
+
+
 class _FakeRedis:
     """Dict-backed stand-in for ``redis.StrictRedis``."""
     def __init__(self, **kw):
@@ -15,6 +55,12 @@ class _FakeRedis:
     def get(self, key):
         return self._store.get(key)
 
+    def mget(self, keys):
+        return [self._store.get(k) for k in keys]
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
     def set(self, key, value):
         self._store[key] = value
 
@@ -24,15 +70,25 @@ class _FakeRedis:
     def delete(self, key):
         self._store.pop(key, None)
 
+    def expire(self, key, ttl):
+        return key in self._store
+
     def ping(self):
         return True
 
     def scan(self, cursor, match=None, count=100):
         """Simulate SCAN with glob-style pattern matching."""
-        import fnmatch
-        matched = [k for k in self._store if fnmatch.fnmatch(k, match or "*")]
+        matches = _compile_glob(match or "*")
+        matched = [k for k in self._store if matches(k.decode() if isinstance(k, bytes) else k)]
         return (0, matched)
 
+    def scan_iter(self, match=None, count=None):
+        """Cursor loop over ``scan``, as redis-py implements it."""
+        cursor = "0"
+        while cursor != 0:
+            cursor, batch = self.scan(cursor=cursor, match=match, count=count)
+            yield from batch
+
 _fake_redis_mod = MagicMock()
 _fake_redis_mod.StrictRedis = _FakeRedis
 sys.modules.setdefault("redis", _fake_redis_mod)
@@ -41,7 +97,14 @@ sys.modules.setdefault("redis", _fake_redis_mod)
 # Imports
 # ---------------------------------------------------------------------------
 
-from st_page_state.utils.converters import serialize_state, deserialize_state
+import streamlit as st
+from st_page_state import PageState, StateVar
+from st_page_state.core.meta import SESSION_STATE_KEY
+from st_page_state.utils.converters import (
+    serialize_state, deserialize_state, serialize_state_bytes, _prepare_for_json, _is_all_native,
+)
+from st_page_state.backends import redis_backend as _redis_backend_mod
+from st_page_state.utils import converters as _converters
 from st_page_state.backends.redis_backend import RedisBackend
 
 
@@ -50,10 +113,48 @@ from st_page_state.backends.redis_backend import RedisBackend
 # ---------------------------------------------------------------------------
 
 def _wait_save(backend: RedisBackend, timeout: float = 2.0):
-    """Block until the backend's async save thread finishes."""
-    t = backend._last_save_thread
-    if t is not None:
-        t.join(timeout)
+    """Block until the backend's async save job finishes."""
+    assert backend.flush(timeout)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_clients():
+    """Drop the process-wide client cache so every test starts with an empty fake store."""
+    _redis_backend_mod._CLIENTS.clear()
+    yield
+    _redis_backend_mod._CLIENTS.clear()
+
+
+class _Spy:
+    """Minimal call recorder for client methods (cheaper than ``MagicMock``).
+
+    *side_effect* is raised if it is an exception, otherwise called with the arguments.
+    """
+    __slots__ = ("calls", "side_effect")
+
+    def __init__(self, side_effect=None):
+        self.calls = []
+        self.side_effect = side_effect
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if isinstance(self.side_effect, BaseException):
+            raise self.side_effect
+        if self.side_effect is not None:
+            return self.side_effect(*args, **kwargs)
+
+    @property
+    def called(self):
+        return bool(self.calls)
+
+    @property
+    def call_count(self):
+        return len(self.calls)
+
+    @property
+    def call_args(self):
+        """``(args, kwargs)`` of the last call."""
+        return self.calls[-1]
 
 
 @pytest.fixture()
@@ -117,6 +218,88 @@ class TestStateSerialization:
         assert result["bad"] is None
         assert result["also_bad"] is None
 
+    def test_reads_payloads_written_by_stdlib_json(self):
+        """Payloads stored before the faster codec was installed stay readable, envelopes included."""
+
+        data = {"when": datetime.date(2025, 1, 1), "pair": (1, {"s": {2}}), "n": [1, 2]}
+        assert deserialize_state(json.dumps(_prepare_for_json(data))) == data
+
+    def test_payload_matches_stdlib_encoding(self):
+        """serialize_state writes the same JSON tree whichever codec is installed (tuples nested in sets/lists included)."""
+
+        data = {
+            "t": (1, (2, 3)), "s": {(1, 2)}, "n": [{"x": (1,)}],
+            "dt": datetime.datetime(2025, 1, 1, 12), "b": b"\x00", "plain": [1, "a", None],
+        }
+        assert json.loads(serialize_state(data)) == json.loads(json.dumps(_prepare_for_json(data)))
+        assert deserialize_state(serialize_state(data)) == data
+
+    def test_native_state_detection(self):
+        """Plain JSON states are recognised, so the stdlib codec can skip the tagged copy."""
+
+        assert _is_all_native({"a": [1, "x", None, {"b": 2.5, "c": True}]})
+        assert not _is_all_native({"a": [1, (2,)]})
+        assert not _is_all_native({"a": {"d": datetime.date(2025, 1, 1)}})
+
+    def test_bytes_payload_matches_text_payload(self):
+        data = {"when": datetime.date(2025, 1, 1), "name": "café", "pair": (1, 2)}
+        assert serialize_state_bytes(data) == serialize_state(data).encode()
+        assert deserialize_state(serialize_state_bytes(data)) == data
+
+    def test_non_string_keys_become_strings(self):
+        assert deserialize_state(serialize_state({"m": {1: "a"}})) == {"m": {"1": "a"}}
+
+    def test_codecs_agree_on_values_orjson_writes_natively(self, monkeypatch):
+        """A state is stored as the same bytes whether or not orjson is installed, enums and UUIDs included."""
+        if _converters.orjson is None:
+            pytest.skip("orjson is not installed")
+
+        class Color(enum.Enum):
+            RED = 1
+
+        class Level(enum.IntEnum):
+            HIGH = 3
+
+        class Ratio(float):
+            pass
+
+        data = {
+            "color": Color.RED, "level": Level.HIGH, "id": uuid.UUID(int=1), "ratio": Ratio(0.5), "ids": {uuid.UUID(int=2)},
+            "name": "café", "pair": (1, [2.5, None]), "when": datetime.datetime(2025, 1, 1, 12), "b": b"\x00", "m": {1: True},
+        }
+        with_orjson = serialize_state_bytes(data)
+
+        monkeypatch.setattr(_converters, "orjson", None)
+        without_orjson = serialize_state_bytes(data)
+
+        assert with_orjson == without_orjson
+        assert json.loads(with_orjson)["color"] is None
+
+    def test_lone_surrogates_still_serialize(self):
+        assert deserialize_state(serialize_state_bytes({"s": "\ud800"})) == {"s": "\ud800"}
+
+    def test_integers_past_64_bits_roundtrip(self):
+        data = {"big": 2**70, "neg": [-(2**64)], "small": 1}
+        result = deserialize_state(serialize_state_bytes(data))
+
+        assert result == data
+        assert type(result["big"]) is int
+
+    def test_non_finite_floats_roundtrip(self):
+        result = deserialize_state(serialize_state_bytes({"nan": float("nan"), "t": (float("inf"),), "n": 1.5}))
+
+        assert math.isnan(result["nan"])
+        assert result["t"] == (float("inf"),)
+        assert result["n"] == 1.5
+
+    def test_reads_non_finite_floats_written_by_stdlib_json(self):
+        raw = json.dumps(_prepare_for_json({"nan": float("nan"), "inf": [float("-inf")], "d": datetime.date(2025, 1, 1)}))
+        result = deserialize_state(raw.encode())
+
+        assert math.isnan(result["nan"])
+        assert result["inf"] == [float("-inf")]
+        assert result["d"] == datetime.date(2025, 1, 1)
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # RedisBackend CRUD
@@ -132,15 +315,15 @@ class TestRedisBackendCRUD:
         assert backend.load("Missing", "sess-x") is None
 
     def test_save_with_ttl_uses_setex(self, backend):
-        backend._client.setex = MagicMock()
+        backend._client.setex = _Spy()
         backend.save("S", "sess", {"a": 1}, ttl=60)
-        backend._client.setex.assert_called_once()
+        assert backend._client.setex.call_count == 1
         assert backend._client.setex.call_args[0][1] == 60
 
     def test_save_without_ttl_uses_set(self, backend):
-        backend._client.set = MagicMock()
+        backend._client.set = _Spy()
         backend.save("S", "sess", {"a": 1}, ttl=None)
-        backend._client.set.assert_called_once()
+        assert backend._client.set.call_count == 1
 
     def test_delete(self, backend):
         backend.save("S", "sess", {"x": 1}, ttl=None)
@@ -154,12 +337,59 @@ class TestRedisBackendCRUD:
         assert backend._key("Cls", "abc") == "st_page_state:abc:Cls"
 
     def test_load_survives_error(self, backend):
-        backend._client.get = MagicMock(side_effect=Exception("boom"))
+        backend._client.get = _Spy(side_effect=Exception("boom"))
         assert backend.load("S", "sess") is None
 
     def test_save_survives_error(self, backend):
-        backend._client.set = MagicMock(side_effect=Exception("boom"))
+        backend._client.set = _Spy(side_effect=Exception("boom"))
+        backend.save("S", "sess", {"a": 1}, ttl=None)
+
+    def test_failure_skips_redis_until_retry(self, backend, monkeypatch):
+        """After a failed call Redis is left alone for retry_interval seconds, then retried."""
+        now = [1000.0]
+        monkeypatch.setattr(_redis_backend_mod.time, "monotonic", lambda: now[0])
+
         backend.save("S", "sess", {"a": 1}, ttl=None)
+        original_get = backend._client.get
+        backend._client.get = _Spy(side_effect=Exception("down"))
+
+        assert backend.load("S", "sess") is None
+        assert backend.load("S", "sess") is None
+        assert backend.load_all("sess") == {}
+        assert backend._client.get.call_count == 1  # the second load never reached Redis
+
+        # Past the retry interval the next call goes through again
+        backend._client.get = original_get
+        now[0] += backend.retry_interval
+        assert backend.load("S", "sess") == {"a": 1}
+
+    def test_successful_ping_ends_the_retry_wait(self, backend):
+        backend._client.get = _Spy(side_effect=Exception("down"))
+        backend.load("S", "sess")
+        assert backend._unavailable()
+
+        assert backend.ping()
+        assert not backend._unavailable()
+
+    def test_compressed_roundtrip(self):
+        b = RedisBackend(compress=True)
+        data = {"tags": ["alpha"] * 50, "when": datetime.date(2025, 1, 1)}
+        b.save("Z", "sess", data, ttl=None)
+
+        raw = b._client.get("st_page_state:sess:Z")
+        assert raw.startswith(b"z:")
+        assert b.load("Z", "sess") == data
+        assert b.load_all("sess") == {"Z": data}
+
+    def test_compressed_backend_reads_uncompressed_payloads(self):
+        b = RedisBackend(compress=True)
+
+        # Written before compression was enabled (str or bytes, depending on the client)
+        b._client.set("st_page_state:sess:Old", serialize_state({"a": 1}))
+        b._client.set(b"st_page_state:sess:Raw", serialize_state({"b": 2}).encode())
+
+        assert b.load("Old", "sess") == {"a": 1}
+        assert b.load_all("sess") == {"Old": {"a": 1}, "Raw": {"b": 2}}
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -210,6 +440,22 @@ class TestConstructor:
         assert b.port == 6379
         assert b.default_ttl is None
         assert b.key_prefix == "st_page_state"
+        assert b.scan_count == 1000
+        assert b.retry_interval == 5.0
+        assert b.socket_timeout == 5.0
+
+    def test_instance_has_no_dict(self):
+        b = RedisBackend()
+        assert not hasattr(b, "__dict__")
+
+    def test_scan_count_is_passed_to_scan(self):
+        b = RedisBackend(scan_count=250)
+        calls = []
+        original_scan = b._client.scan
+        b._client.scan = lambda cursor=0, match=None, count=None: (calls.append(count), original_scan(cursor, match, count))[1]
+
+        b.load_all("default")
+        assert calls == [250]
 
     def test_session_id_string(self):
         b = RedisBackend(session_id="juan")
@@ -230,6 +476,20 @@ class TestConstructor:
         b2 = RedisBackend()
         assert b1 is b2
 
+    def test_client_shared_across_sessions(self):
+        """Backends of different sessions with the same settings share one client (one connection pool)."""
+
+        b1 = RedisBackend(host="shared")
+        st.session_state.clear()  # a new browser session
+        b2 = RedisBackend(host="shared")
+
+        assert b1 is not b2
+        assert b1._client is b2._client
+
+        st.session_state.clear()
+        b3 = RedisBackend(host="other")
+        assert b3._client is not b1._client
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # session() context manager
@@ -238,10 +498,6 @@ class TestConstructor:
 class TestSession:
 
     def test_load_and_save_roundtrip(self):
-        import streamlit as st
-        from st_page_state import PageState, StateVar
-        from st_page_state.core.meta import SESSION_STATE_KEY
-
         b = RedisBackend(default_ttl=600)
         b.save("RoundTripState", "default", {"count": 99}, ttl=None)
 
@@ -258,9 +514,7 @@ class TestSession:
         assert saved["count"] == 200
 
     def test_per_class_ttl(self):
-        from st_page_state import PageState, StateVar
-
-        spy_setex = MagicMock(side_effect=_FakeRedis().setex)
+        spy_setex = _Spy(side_effect=_FakeRedis().setex)
         b = RedisBackend(default_ttl=3600)
         b._client.setex = spy_setex
 
@@ -276,11 +530,352 @@ class TestSession:
         assert spy_setex.called
         assert spy_setex.call_args[0][1] == 30
 
+    def test_single_round_trip_per_direction(self):
+        """All classes are loaded with one MGET and saved with one pipeline."""
+
+        b = RedisBackend(default_ttl=None, session_id="batch")
+        b.save("BatchA", "batch", {"a": 1}, ttl=None)
+        b.save("BatchB", "batch", {"b": 2}, ttl=None)
+
+        class BatchA(PageState):
+            a: int = StateVar(default=0)
+
+        class BatchB(PageState):
+            b: int = StateVar(default=0)
+
+        spy_mget = _Spy(side_effect=b._client.mget)
+        spy_pipeline = _Spy(side_effect=b._client.pipeline)
+        b._client.mget = spy_mget
+        b._client.pipeline = spy_pipeline
+
+        with b.session():
+            assert BatchA.a == 1 and BatchB.b == 2
+            BatchA.a = 10
+            BatchB.b = 20
+
+        _wait_save(b)
+        assert spy_mget.call_count == 1
+        assert spy_pipeline.call_count == 1
+        assert b.load("BatchA", "batch") == {"a": 10}
+        assert b.load("BatchB", "batch") == {"b": 20}
+
+    def test_failed_write_does_not_block_other_classes(self, caplog):
+        """A command failing inside the save pipeline is logged for its class only."""
+
+        b = RedisBackend(default_ttl=None, session_id="partial")
+
+        class GoodState(PageState):
+            g: int = StateVar(default=0)
+
+        class BadState(PageState):
+            x: int = StateVar(default=0)
+
+        original_set = b._client.set
+
+        def failing_set(key, value):
+            if key.endswith(":BadState"):
+                raise ConnectionError("boom")
+            original_set(key, value)
+
+        b._client.set = failing_set
+
+        with b.session():
+            GoodState.g = 1
+            BadState.x = 1
+
+        _wait_save(b)
+        assert b.load("GoodState", "partial") == {"g": 1}
+        assert b.load("BadState", "partial") is None
+        assert "st_page_state:partial:BadState" in caplog.text
+        assert "GoodState" not in caplog.text
+
+    def test_dropped_save_is_retried_on_the_next_rerun(self, monkeypatch):
+        """Snapshots that failed to write, or were skipped while Redis is unavailable, go out with the next save."""
+
+        now = [1000.0]
+        monkeypatch.setattr(_redis_backend_mod.time, "monotonic", lambda: now[0])
+
+        b = RedisBackend(default_ttl=None, session_id="retry")
+        key = "st_page_state:retry:RetryState"
+
+        class RetryState(PageState):
+            n: int = StateVar(default=0)
+
+        # The SET fails inside the pipeline
+        original_set = b._client.set
+        b._client.set = _Spy(side_effect=ConnectionError("boom"))
+        with b.session():
+            RetryState.n = 1
+        _wait_save(b)
+        assert key not in b._client._store
+
+        # A rerun without new assignments sends it again
+        b._client.set = original_set
+        with b.session():
+            pass
+        _wait_save(b)
+        assert b.load("RetryState", "retry") == {"n": 1}
+
+        # The whole pipeline fails: Redis is skipped for retry_interval seconds
+        original_pipeline = b._client.pipeline
+        b._client.pipeline = _Spy(side_effect=ConnectionError("down"))
+        with b.session():
+            RetryState.reset()
+        _wait_save(b)
+
+        b._client.pipeline = original_pipeline
+        with b.session():
+            pass
+        _wait_save(b)
+        assert b.load("RetryState", "retry") is None  # still waiting
+        assert deserialize_state(b._client._store[key]) == {"n": 1}
+
+        # Past the wait the reset to defaults is written
+        now[0] += b.retry_interval
+        with b.session():
+            pass
+        _wait_save(b)
+        assert b.load("RetryState", "retry") == {"n": 0}
+
+    def test_unexpected_flush_error_does_not_stop_later_saves(self, monkeypatch, caplog):
+        """A flush ending in an unexpected error is logged, and its snapshots go out with the next save."""
+
+        b = RedisBackend(default_ttl=None, session_id="crash")
+
+        class CrashState(PageState):
+            n: int = StateVar(default=0)
+
+        def crash(self, entries):
+            raise RuntimeError("unexpected")
+
+        monkeypatch.setattr(RedisBackend, "_write_entries", crash)
+        with b.session():
+            CrashState.n = 1
+        _wait_save(b)
+
+        assert "unexpected" in caplog.text
+        assert b.load("CrashState", "crash") is None
+
+        monkeypatch.undo()
+        with b.session():
+            pass
+        _wait_save(b)
+        assert b.load("CrashState", "crash") == {"n": 1}
+
+    def test_pending_saves_coalesce(self, monkeypatch):
+        """Saves queued before the pool runs the flush collapse into one write, last value wins."""
+
+        jobs = []
+
+        class _ManualExecutor:
+            def submit(self, fn, *args):
+                jobs.append((fn, args))
+                return Future()
+
+        monkeypatch.setattr(_redis_backend_mod, "_SAVE_EXECUTOR", _ManualExecutor())
+
+        b = RedisBackend(default_ttl=None, session_id="burst")
+
+        class BurstState(PageState):
+            n: int = StateVar(default=0)
+
+        for value in (1, 2, 3):
+            with b.session():
+                BurstState.n = value
+
+        # One flush queued for the three reruns
+        assert len(jobs) == 1
+
+        spy_pipeline = _Spy(side_effect=b._client.pipeline)
+        b._client.pipeline = spy_pipeline
+
+        fn, args = jobs.pop()
+        fn(*args)
+
+        assert spy_pipeline.call_count == 1
+        assert b.load("BurstState", "burst") == {"n": 3}
+
+        # The next change schedules a new flush
+        with b.session():
+            BurstState.n = 4
+        assert len(jobs) == 1
+
+    def test_saves_queued_during_a_flush_are_written_after_it(self):
+        """Snapshots queued while a batch is being written join the running flush, in order."""
+
+        b = RedisBackend(default_ttl=None, session_id="order")
+
+        class OrderState(PageState):
+            n: int = StateVar(default=0)
+
+        written = []
+        original_set = b._client.set
+
+        def recording_set(key, value):
+            written.append(deserialize_state(value)["n"])
+            original_set(key, value)
+
+            # A rerun finishing while the first batch is in flight
+            if len(written) == 1:
+                with b.session():
+                    OrderState.n = 2
+                futures.append(b._last_save_future)
+
+        b._client.set = recording_set
+
+        futures = []
+        with b.session():
+            OrderState.n = 1
+        futures.append(b._last_save_future)
+
+        _wait_save(b)
+        assert written == [1, 2]
+        assert futures[0] is futures[1]  # no second flush was scheduled
+        assert b.load("OrderState", "order") == {"n": 2}
+
+    def test_flush_waits_for_background_saves(self):
+        """flush() returns once queued saves are written, and reports a timeout while they still run."""
+
+        b = RedisBackend(default_ttl=None, session_id="flush")
+        assert b.flush(0)  # nothing queued yet
+
+        class FlushState(PageState):
+            n: int = StateVar(default=0)
+
+        release = threading.Event()
+        original_set = b._client.set
+
+        def blocking_set(key, value):
+            release.wait(2)
+            original_set(key, value)
+
+        b._client.set = blocking_set
+
+        with b.session():
+            FlushState.n = 1
+
+        assert not b.flush(0.01)
+        release.set()
+        assert b.flush(2)
+        assert b.load("FlushState", "flush") == {"n": 1}
+
+    def test_fresh_default_state_is_not_saved(self):
+        """A class that only holds defaults and has no key yet is not written; resetting a stored one is."""
+
+        b = RedisBackend(default_ttl=None, session_id="fresh")
+
+        class FreshState(PageState):
+            n: int = StateVar(default=0)
+            tags: list = StateVar(default=[])
+
+        # First run: every field is seeded with its default
+        with b.session():
+            assert FreshState.n == 0 and FreshState.tags == []
+
+        _wait_save(b)
+        assert b.load("FreshState", "fresh") is None
+
+        with b.session():
+            FreshState.n = 3
+
+        _wait_save(b)
+        assert b.load("FreshState", "fresh") == {"n": 3, "tags": []}
+
+        # Back to the defaults: the stored key must follow
+        with b.session():
+            FreshState.reset()
+
+        _wait_save(b)
+        assert b.load("FreshState", "fresh") == {"n": 0, "tags": []}
+
+    def test_unchanged_state_is_not_saved(self):
+        """Classes whose fields were not assigned since the last load/save are not written back."""
+
+        b = RedisBackend(default_ttl=600)
+        b.save("UnchangedState", "default", {"n": 1}, ttl=None)
+
+        class UnchangedState(PageState):
+            n: int = StateVar(default=0)
+
+        spy_setex = _Spy(side_effect=_FakeRedis().setex)
+        b._client.setex = spy_setex
+
+        # Reading only — nothing to persist
+        with b.session():
+            assert UnchangedState.n == 1
+
+        _wait_save(b)
+        assert not spy_setex.called
+
+        # Assigning marks the class as changed
+        with b.session():
+            UnchangedState.n = 2
+
+        _wait_save(b)
+        assert spy_setex.called
+
+    def test_equal_content_is_not_rewritten(self):
+        """Re-assigning equal content skips the SET; keys with a TTL only get EXPIRE."""
+
+        b = RedisBackend(default_ttl=None, session_id="digest")
+
+        class DigestState(PageState):
+            tags: list = StateVar(default=[])
+
+        class DigestTTLState(PageState):
+            class Config:
+                ttl = 60
+
+            tags: list = StateVar(default=[])
+
+        with b.session():
+            DigestState.tags = ["a"]
+            DigestTTLState.tags = ["a"]
+        _wait_save(b)
+
+        spy_set = _Spy(side_effect=b._client.set)
+        spy_setex = _Spy(side_effect=b._client.setex)
+        spy_expire = _Spy(side_effect=b._client.expire)
+        b._client.set, b._client.setex, b._client.expire = spy_set, spy_setex, spy_expire
+
+        # Equal lists: the classes are marked changed, but the content is not
+        with b.session():
+            DigestState.tags = ["a"]
+            DigestTTLState.tags = ["a"]
+        _wait_save(b)
+
+        assert not spy_set.called
+        assert not spy_setex.called
+        assert spy_expire.calls == [(("st_page_state:digest:DigestTTLState", 60), {})]
+
+        # A key that expired behind our back is rewritten by the same save
+        b._client.delete("st_page_state:digest:DigestTTLState")
+        with b.session():
+            DigestTTLState.tags = ["a"]
+        _wait_save(b)
+
+        assert spy_setex.call_count == 1
+        assert b.load("DigestTTLState", "digest") == {"tags": ["a"]}
+
+        # A key removed through the backend is written again, with or without a TTL
+        b.delete("DigestState", "digest")
+        with b.session():
+            DigestState.tags = ["a"]
+        _wait_save(b)
+
+        assert spy_set.call_count == 1
+        assert b.load("DigestState", "digest") == {"tags": ["a"]}
+
+        # So is a key overwritten by an explicit save()
+        b.save("DigestState", "digest", {"tags": ["b"]}, ttl=None)
+        with b.session():
+            DigestState.tags = ["a"]
+        _wait_save(b)
+
+        assert b.load("DigestState", "digest") == {"tags": ["a"]}
+
     def test_skip_load_when_session_is_warm(self):
         """Redis load is skipped when session_state already has data."""
-        import streamlit as st
-        from st_page_state import PageState, StateVar
-        from st_page_state.core.meta import SESSION_STATE_KEY
 
         b = RedisBackend(default_ttl=600)
 
@@ -293,15 +888,18 @@ class TestSession:
         st.session_state.setdefault(SESSION_STATE_KEY, {})
         st.session_state[SESSION_STATE_KEY]["WarmState"] = {"count": 100}
 
+        spy_mget = _Spy(side_effect=b._client.mget)
+        b._client.mget = spy_mget
+
         with b.session():
             ns = st.session_state[SESSION_STATE_KEY]["WarmState"]
             assert ns["count"] == 100
 
+        # The warm class is not even fetched
+        assert not spy_mget.called
+
     def test_custom_session_id_string(self):
         """A fixed session_id string routes all data under that identity."""
-        import streamlit as st
-        from st_page_state import PageState, StateVar
-        from st_page_state.core.meta import SESSION_STATE_KEY
 
         b = RedisBackend(default_ttl=600, session_id="juan")
         b.save("IdState", "juan", {"val": 7}, ttl=None)
@@ -319,9 +917,6 @@ class TestSession:
 
     def test_custom_session_id_callable(self):
         """A callable session_id is invoked each time."""
-        import streamlit as st
-        from st_page_state import PageState, StateVar
-        from st_page_state.core.meta import SESSION_STATE_KEY
 
         current_user = "alice"
         b = RedisBackend(default_ttl=600, session_id=lambda: current_user)
@@ -346,9 +941,6 @@ class TestIdentityTransition:
 
     def test_identity_change_clears_and_reloads(self):
         """When session_id changes, old state is wiped and new user data loads."""
-        import streamlit as st
-        from st_page_state import PageState, StateVar
-        from st_page_state.core.meta import SESSION_STATE_KEY
 
         identity = "anonymous"
         b = RedisBackend(default_ttl=600, session_id=lambda: identity)
@@ -377,9 +969,6 @@ class TestIdentityTransition:
 
     def test_same_identity_keeps_warm_session(self):
         """Repeated runs with the same identity don't re-load (session is warm)."""
-        import streamlit as st
-        from st_page_state import PageState, StateVar
-        from st_page_state.core.meta import SESSION_STATE_KEY
 
         b = RedisBackend(default_ttl=600, session_id="bob")
         b.save("WarmCheck", "bob", {"x": 10}, ttl=None)
@@ -410,9 +999,6 @@ class TestURLPriorityOverRedis:
 
     def test_url_param_takes_precedence_over_redis(self):
         """Fields whose url_key is in query_params are skipped during Redis LOAD."""
-        import streamlit as st
-        from st_page_state import PageState, StateVar
-        from st_page_state.core.meta import SESSION_STATE_KEY
 
         b = RedisBackend(default_ttl=600, session_id="url-test")
         b.save("URLState", "url-test", {"page": "home", "count": 42}, ttl=None)
@@ -431,11 +1017,26 @@ class TestURLPriorityOverRedis:
             # "count" WAS loaded from Redis (no url_key conflict)
             assert ns.get("count") == 42
 
+    def test_url_overriding_every_stored_field_still_marks_the_class_stored(self):
+        """A class whose stored fields are all overridden by the URL is known to Redis, so its defaults are written."""
+
+        b = RedisBackend(default_ttl=None, session_id="url-known")
+        b.save("URLKnownState", "url-known", {"page": "home"}, ttl=None)
+
+        class URLKnownState(PageState):
+            page: str = StateVar(default="index", url_key="p")
+
+        # The URL carries the default value
+        st.query_params["p"] = "index"
+
+        with b.session():
+            assert URLKnownState.page == "index"
+
+        _wait_save(b)
+        assert b.load("URLKnownState", "url-known") == {"page": "index"}
+
     def test_no_url_overlap_loads_everything(self):
         """When no URL params overlap, all fields load from Redis normally."""
-        import streamlit as st
-        from st_page_state import PageState, StateVar
-        from st_page_state.core.meta import SESSION_STATE_KEY
 
         b = RedisBackend(default_ttl=600, session_id="full-load")
         b.save("FullState", "full-load", {"a": 1, "b": 2}, ttl=None)
@@ -1,6 +1,6 @@
 import pytest
 from st_page_state.utils.converters import convert_to_URL, convert_from_URL
-from typing import List, Dict, Any
+from typing import List, Set, Dict, Any
 
 class TestURLSerialization:
     """Tests for URL serialization and deserialization logic."""
@@ -72,3 +72,124 @@ class TestURLSerialization:
         encoded = convert_to_URL("test_key", value, value_map)
         
         assert isinstance(encoded, str)
+
+    def test_int_list_uses_plain_separator_format(self):
+        """Test that non-empty integer lists skip JSON + Base64 and still round-trip."""
+
+        encoded = convert_to_URL("test_key", [1, 20, -3])
+        assert encoded == "1||20||-3"
+
+        assert convert_from_URL("test_key", encoded, List[int]) == [1, 20, -3]
+        assert convert_from_URL("test_key", encoded, Set[int]) == {1, 20, -3}
+
+    def test_bool_list_is_not_treated_as_int_list(self):
+        """Test that lists of bools keep the Base64 JSON format (bool is an int subclass)."""
+
+        encoded = convert_to_URL("test_key", [True, False])
+        assert "||" not in encoded
+        assert convert_from_URL("test_key", encoded, List[bool]) == [True, False]
+
+    def test_list_url_value_is_unpadded_and_reads_padded_urls(self):
+        """Test that Base64 list values drop the "=" padding, while previously shared padded URLs still parse."""
+
+        encoded = convert_to_URL("test_key", ["a", "bc"])
+        assert "=" not in encoded
+        assert convert_from_URL("test_key", encoded, List[str]) == ["a", "bc"]
+
+        # Produced by the former stdlib encoder: urlsafe_b64encode(json.dumps(["a", "bc"]))
+        legacy = "WyJhIiwgImJjIl0="
+        assert convert_from_URL("test_key", legacy, List[str]) == ["a", "bc"]
+
+    def test_scalar_conversions_are_cached_per_type(self):
+        """Test that repeated scalar conversions hit the cache, without mixing up equal values of different types."""
+        import datetime
+        from st_page_state.utils.converters import _parse_scalar
+
+        _parse_scalar.cache_clear()
+        for _ in range(3):
+            assert convert_from_URL("k", "42", int) == 42
+        assert _parse_scalar.cache_info().hits == 2
+
+        # True == 1 and hash(True) == hash(1), but they convert differently
+        assert convert_to_URL("k", True) == "true"
+        assert convert_to_URL("k", 1) == "1"
+        assert convert_to_URL("k", 1.0) == "1.0"
+
+        # Equal values that format differently are not served from each other's entry
+        assert convert_to_URL("k", 0.0) == "0.0"
+        assert convert_to_URL("k", -0.0) == "-0.0"
+        utc = datetime.datetime(2024, 1, 1, 12, 0, tzinfo=datetime.timezone.utc)
+        shifted = utc.astimezone(datetime.timezone(datetime.timedelta(hours=2)))
+        assert convert_to_URL("k", utc) == "2024-01-01T12:00:00+00:00"
+        assert convert_to_URL("k", shifted) == "2024-01-01T14:00:00+02:00"
+        decoded = convert_from_URL("k", convert_to_URL("k", [utc, shifted]), List[datetime.datetime])
+        assert [v.utcoffset() for v in decoded] == [utc.utcoffset(), shifted.utcoffset()]
+        assert [str(v) for v in convert_from_URL("k", convert_to_URL("k", [0.0, -0.0]), List[float])] == ["0.0", "-0.0"]
+
+        # Iterable results are never shared between calls
+        first = convert_from_URL("k", "1||2", List[int])
+        first.append(3)
+        assert convert_from_URL("k", "1||2", List[int]) == [1, 2]
+
+    def test_precomputed_reverse_map_is_used(self):
+        """Test that a precomputed reverse map is used as-is instead of being rebuilt from value_map."""
+        from st_page_state import StateVar
+
+        var = StateVar(default=0, url_key="s", value_map={0: "pending", 1: "active"})
+        assert var._reverse_value_map == {"pending": 0, "active": 1}
+
+        assert convert_from_URL("s", "active", int, var.value_map, var._reverse_value_map) == 1
+        assert convert_from_URL("s", "active", int, var.value_map) == 1
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("true", True), ("1", True), ("on", True), ("True", True), ("YES", True),
+        ("false", False), ("0", False), ("off", False), ("", False),
+    ])
+    def test_bool_parsing_is_case_insensitive(self, raw, expected):
+        """Test that bool values are read case-insensitively from the URL."""
+
+        assert convert_from_URL("flag", raw, bool) is expected
+
+    def test_scalar_list_items_are_converted_in_place(self):
+        """Test that lists of scalars round-trip without per-item recursion and report the failing item."""
+        import datetime
+        from st_page_state.errors import InvalidQueryParamError
+
+        days = [datetime.date(2024, 1, 1), datetime.date(2024, 2, 29)]
+        assert convert_from_URL("d", convert_to_URL("d", days), List[datetime.date]) == days
+
+        with pytest.raises(InvalidQueryParamError, match=r"n\[1\]"):
+            convert_from_URL("n", convert_to_URL("n", ["1", "x"]), List[int])
+
+    def test_invalid_query_param_error_message(self):
+        """Test that the error keeps its fields, formats its message on demand and survives pickling."""
+        import pickle
+        from st_page_state.errors import InvalidQueryParamError
+
+        error = InvalidQueryParamError("n", "x", int, ValueError("bad"))
+        assert (error.key, error.value, error.target_type) == ("n", "x", int)
+        assert str(error) == "Failed to parse query param 'n=x' as <class 'int'>: bad"
+        assert str(pickle.loads(pickle.dumps(error))) == str(error)
+
+    def test_field_decoder_matches_convert_from_URL(self):
+        """Test that a per-field decoder converts exactly like convert_from_URL, errors included."""
+        from st_page_state.utils.converters import make_URL_decoder
+        from st_page_state.errors import InvalidQueryParamError
+
+        value_map = {0: "pending", 1: "active"}
+        cases = [
+            (int, None, ["1", "active"]),
+            (int, value_map, ["active", "pending", "7"]),
+            (bool, None, ["true", "off"]),
+            (List[int], None, ["1||2", convert_to_URL("k", [3, 4])]),
+        ]
+        for dtype, vmap, raws in cases:
+            decode = make_URL_decoder("k", dtype, vmap)
+            for raw in raws:
+                try:
+                    expected = convert_from_URL("k", raw, dtype, vmap)
+                except InvalidQueryParamError:
+                    with pytest.raises(InvalidQueryParamError):
+                        decode(raw)
+                else:
+                    assert decode(raw) == expected
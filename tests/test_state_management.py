@@ -1,5 +1,6 @@
 import pytest
 from st_page_state import PageState, StateVar
+from st_page_state.core.meta import SESSION_STATE_KEY
 import streamlit as st
 
 class TestStateManagement:
@@ -49,3 +50,113 @@ class TestStateManagement:
         
         dump = DumpState.dump()
         assert dump == {"a": 1, "b": 2}
+
+    def test_dump_without_copy_returns_live_namespace(self):
+        """Test that dump(copy=False) exposes the session namespace itself."""
+        class LiveDumpState(PageState):
+            a: int = StateVar(default=1)
+
+        _ = LiveDumpState.a
+
+        assert LiveDumpState.dump(copy=False) is st.session_state[SESSION_STATE_KEY]["LiveDumpState"]
+        assert LiveDumpState.dump() is not LiveDumpState.dump(copy=False)
+
+    def test_reset_all_syncs_url_and_fires_hooks(self):
+        """Test that reset() restores defaults in the URL and calls on_change for changed fields."""
+        changes = []
+
+        class ResetAllState(PageState):
+            q: str = StateVar(default="default", url_key="q")
+            n: int = StateVar(default=1)
+            tags: list = StateVar(default=["a"])
+
+            @classmethod
+            def on_change(cls, field, old_value, new_value):
+                changes.append((field, old_value, new_value))
+
+        ResetAllState.q = "changed"
+        ResetAllState.n = 5
+        ResetAllState.tags = ["b"]
+        changes.clear()
+
+        ResetAllState.reset()
+
+        assert ResetAllState.dump() == {"q": "default", "n": 1, "tags": ["a"]}
+        assert st.query_params["q"] == "default"
+        assert sorted(changes) == [("n", 5, 1), ("q", "changed", "default"), ("tags", ["b"], ["a"])]
+
+    def test_reset_does_not_share_mutable_defaults(self):
+        """Test that reset() hands out copies of mutable defaults."""
+        class MutableResetState(PageState):
+            items: list = StateVar(default=[])
+
+        MutableResetState.reset()
+        MutableResetState.items.append(1)
+
+        MutableResetState.reset("items")
+        assert MutableResetState.items == []
+
+    def test_nested_defaults_are_deep_copied(self):
+        """Test that defaults holding mutable items are copied deeply, flat ones shallowly."""
+        class NestedDefaultState(PageState):
+            matrix: list = StateVar(default=[[1, 2], [3]])
+            tags: list = StateVar(default=["a"])
+            pair: tuple = StateVar(default=(1, "x"))
+
+        NestedDefaultState.matrix[0].append(99)
+        NestedDefaultState.tags.append("b")
+
+        NestedDefaultState.reset()
+        assert NestedDefaultState.matrix == [[1, 2], [3]]
+        assert NestedDefaultState.tags == ["a"]
+        assert NestedDefaultState.pair == (1, "x")
+
+    def test_reset_of_default_state_skips_write(self):
+        """Test that resetting fields already at their immutable defaults leaves the namespace unchanged."""
+        from st_page_state.core.meta import VERSION_STATE_KEY
+
+        class ResetNoopState(PageState):
+            count: int = StateVar(default=1)
+            name: str = StateVar(default="a")
+
+        ResetNoopState.reset()
+        version = st.session_state[VERSION_STATE_KEY]["ResetNoopState"]
+
+        # Already at the defaults: nothing to write
+        ResetNoopState.reset()
+        assert st.session_state[VERSION_STATE_KEY]["ResetNoopState"] == version
+
+        # One changed field: one write for the assignment, one for the reset
+        ResetNoopState.count = 5
+        ResetNoopState.reset()
+        assert ResetNoopState.count == 1
+        assert st.session_state[VERSION_STATE_KEY]["ResetNoopState"] == version + 2
+
+    def test_setting_equal_value_skips_write(self):
+        """Test that re-setting an equal immutable value leaves the namespace unchanged, while containers are always written."""
+        from st_page_state.core.meta import VERSION_STATE_KEY
+
+        class SameValueState(PageState):
+            count: int = StateVar(default=1)
+            flag: bool = StateVar(default=False)
+            items: list = StateVar(default=[])
+
+        SameValueState.count = 1
+        version = st.session_state[VERSION_STATE_KEY]["SameValueState"]
+
+        # Equal immutable value: no write
+        SameValueState.count = 1
+        assert st.session_state[VERSION_STATE_KEY]["SameValueState"] == version
+
+        # Equal but different type (0 == False): written, type preserved
+        _ = SameValueState.flag
+        version = st.session_state[VERSION_STATE_KEY]["SameValueState"]
+        SameValueState.flag = 0
+        assert st.session_state[VERSION_STATE_KEY]["SameValueState"] == version + 1
+        assert type(SameValueState.flag) is int
+
+        # Containers are always written (they may have been mutated in place)
+        _ = SameValueState.items
+        version = st.session_state[VERSION_STATE_KEY]["SameValueState"]
+        SameValueState.items = []
+        assert st.session_state[VERSION_STATE_KEY]["SameValueState"] == version + 1
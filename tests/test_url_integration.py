@@ -48,3 +48,121 @@ class TestUrlIntegration:
         # Test setting value updates URL with friendly name
         TaskState.status = 0
         assert st.query_params["status"] == "pending"
+
+    def test_url_value_for(self):
+        """Test that url_value_for returns the URL representation of a value, honoring value_map."""
+        class LookupState(PageState):
+            status: int = StateVar(
+                default=0,
+                url_key="status",
+                value_map={0: "pending", 1: "active"}
+            )
+            page: int = StateVar(default=1, url_key="page")
+
+        assert LookupState.url_value_for("status", 1) == "active"
+        assert LookupState.url_value_for("page", 3) == "3"
+
+        with pytest.raises(ValueError):
+            LookupState.url_value_for("missing", 1)
+
+    def test_schema_is_read_only(self):
+        """Test that schema() exposes the metadata without allowing mutation."""
+        class SchemaState(PageState):
+            q: str = StateVar(default="x", url_key="q")
+
+        schema = SchemaState.schema()
+        assert schema["q"]["url_key"] == "q"
+
+        with pytest.raises(TypeError):
+            schema["q"] = {}
+
+    def test_init_from_url_with_prefix(self):
+        """Test that lazy initialization reads the prefixed URL key."""
+        st.query_params["pre_page"] = "7"
+
+        class PrefixedInitState(PageState):
+            class Config:
+                url_prefix = "pre_"
+
+            page: int = StateVar(default=1, url_key="page")
+
+        assert PrefixedInitState.page == 7
+
+    def test_hydrate_all(self):
+        """Test that hydrate_all seeds several classes from the URL and defaults in one pass."""
+        st.query_params["h_name"] = "from_url"
+        st.query_params["count"] = "3"
+
+        class HydrateA(PageState):
+            class Config:
+                url_prefix = "h_"
+
+            name: str = StateVar(default="default", url_key="name")
+            local: list = StateVar(default=[1, 2])
+
+        class HydrateB(PageState):
+            count: int = StateVar(default=0, url_key="count")
+
+        PageState.hydrate_all(HydrateA, HydrateB)
+
+        ns = st.session_state["_st_page_state"]
+        assert ns["HydrateA"] == {"name": "from_url", "local": [1, 2]}
+        assert ns["HydrateB"] == {"count": 3}
+
+        # Defaults are copied, not shared
+        assert ns["HydrateA"]["local"] is not HydrateA.schema()["local"]["default"]
+
+    def test_hydrate_all_keeps_initialized_fields(self):
+        """Test that hydrate_all does not overwrite values that are already in session state."""
+        class HydrateKeep(PageState):
+            q: str = StateVar(default="default", url_key="q")
+
+        HydrateKeep.q = "set_by_user"
+        st.query_params["q"] = "from_url"
+
+        PageState.hydrate_all(HydrateKeep)
+
+        assert HydrateKeep.q == "set_by_user"
+
+    def test_hydrate_all_ignores_url_keys_of_redefined_classes(self):
+        """Test that a class redefined with another url_key is not seeded from its old key."""
+        st.query_params["old"] = "stale"
+
+        class Redefined(PageState):
+            v: str = StateVar(default="d", url_key="old")
+
+        class Redefined(PageState):  # noqa: F811 (rerun of a script that renamed the key)
+            v: str = StateVar(default="d", url_key="new")
+
+        PageState.hydrate_all(Redefined)
+        assert Redefined.v == "d"
+
+    def test_hydrate_all_only_marks_seeded_classes_changed(self):
+        """Test that a hydrate_all call that seeds nothing leaves the class version alone."""
+        from st_page_state.core.meta import VERSION_STATE_KEY
+
+        class HydrateVersion(PageState):
+            n: int = StateVar(default=0)
+
+        PageState.hydrate_all(HydrateVersion)
+        version = st.session_state[VERSION_STATE_KEY]["HydrateVersion"]
+
+        # Every later rerun finds the class initialized
+        PageState.hydrate_all(HydrateVersion)
+        assert st.session_state[VERSION_STATE_KEY]["HydrateVersion"] == version
+
+    def test_rewriting_same_value_skips_url_update(self, query_param_writes):
+        """Test that re-asserting the current value (e.g. a widget callback per rerun) does not push a URL update."""
+        class NavState(PageState):
+            view: str = StateVar(default="home", url_key="view")
+
+        binding = NavState.bind("view")
+        assert st.query_params == {"view": "home"}
+        query_param_writes.clear()
+
+        # The widget fires with the value already in the URL
+        st.session_state[binding["key"]] = "home"
+        binding["on_change"]()
+        _ = NavState.view
+
+        assert query_param_writes == []
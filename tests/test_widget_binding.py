@@ -1,3 +1,4 @@
+import sys
 import pytest
 from st_page_state import PageState, StateVar
 import streamlit as st
@@ -80,3 +81,29 @@ class TestWidgetBinding:
         
         # Should still be 42, not 100
         assert st.session_state[widget_key] == 42
+
+    def test_binding_reuses_callback_across_calls(self):
+        """Test that repeated bind() calls (one per rerun) reuse the same key and callback."""
+        class ReuseState(PageState):
+            value: int = StateVar(default=0)
+
+        first = ReuseState.bind("value")
+        second = ReuseState.bind("value")
+
+        assert first == second
+        assert first["on_change"] is second["on_change"]
+
+        # The reused callback still writes to the state
+        st.session_state[first["key"]] = 7
+        second["on_change"]()
+        assert ReuseState.value == 7
+
+    def test_binding_key_is_interned(self):
+        """Test that the widget key is computed once at class creation and interned."""
+        class InternState(PageState):
+            value: int = StateVar(default=0)
+
+        key = InternState.bind("value")["key"]
+
+        assert key is InternState._widget_keys["value"]
+        assert key is sys.intern("InternState_value_widget")